@@ -8,6 +8,20 @@ import streamlit as st
 
 _ENV_LOADED_FLAG = "_SL_TOOLS_ENV_LOADED"
 
+# Static HTML blocks, built once per process. They are still emitted on every rerun: Streamlit
+# drops any element a rerun does not re-emit, so skipping them would un-hide the nav entry.
+_SIDEBAR_CSS = """
+<style>
+[data-testid="stSidebarNav"] li:first-child {display: none !important;}
+</style>
+"""
+_FOOTER_HTML = """
+<div style="text-align:center; font-size:0.9em; margin-top:2rem; opacity:0.85;">
+  If this tool helps you, consider
+  <a href="https://patreon.com/Lorkus" target="_blank">supporting continued development ❤️</a>
+</div>
+"""
+
 
 def setup_page(title: str, layout: str = "wide") -> None:
     """Set common page config and load environment variables once."""
@@ -16,24 +30,9 @@ def setup_page(title: str, layout: str = "wide") -> None:
         os.environ[_ENV_LOADED_FLAG] = "1"
     st.set_page_config(page_title=title, layout=layout)
     # Hide the implicit main page entry in the sidebar nav.
-    st.markdown(
-        """
-        <style>
-        [data-testid="stSidebarNav"] li:first-child {display: none !important;}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_SIDEBAR_CSS, unsafe_allow_html=True)
 
 
 def render_footer() -> None:
     """Render a small footer at the bottom of the main page."""
-    st.markdown(
-        """
-        <div style="text-align:center; font-size:0.9em; margin-top:2rem; opacity:0.85;">
-          If this tool helps you, consider
-          <a href="https://patreon.com/Lorkus" target="_blank">supporting continued development ❤️</a>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+import numpy as np
+import orjson
+import pandas as pd
 import streamlit as st
+from cachetools import TTLCache
 
 from scholar_helper.models import AggregatedTotals, CategoryTotals, PriceQuotes, RewardEntry, SeasonWindow, TournamentResult
 from scholar_helper.services.aggregation import aggregate_totals, filter_tournaments_for_season  # noqa: F401
@@ -14,11 +18,15 @@ from scholar_helper.services.api import (
     fetch_tournaments,
     fetch_unclaimed_balance_history,
 )
+from scholar_helper.services.api_async import UserBundle, fetch_all_sync
+from scholar_helper.services.disk_cache import ttl_window
 from scholar_helper.services.storage import (  # noqa: F401
     get_last_supabase_error,
     get_supabase_client,
     upsert_season_totals,
+    upsert_season_totals_many,
     upsert_tournament_logs,
+    upsert_tournament_logs_many,
 )
 
 try:
@@ -34,31 +42,165 @@ except ImportError:  # pragma: no cover - fallback for older deployments
         return False
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def cached_season() -> SeasonWindow:
+AGGREGATE_WORKERS = 4
+# Prices are tiny and move quickly; the season window only changes at the boundary; per-user
+# payloads are large and churn slowly within a season.
+SEASON_TTL_SECONDS = 3600
+PRICES_TTL_SECONDS = 60
+USER_DATA_TTL_SECONDS = 600
+# Saved history is also written by the daily sync in another process, which cannot clear this cache.
+HISTORY_TTL_SECONDS = 60
+
+# Indexes built from in-progress or partially fetched tournaments must age out with the data behind them.
+_finish_index_cache: TTLCache = TTLCache(maxsize=4096, ttl=USER_DATA_TTL_SECONDS)
+_finish_index_lock = threading.Lock()
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _persisted_season(window: int) -> SeasonWindow:
     return fetch_current_season()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
-def cached_prices():
+@st.cache_data(show_spinner=False, persist="disk")
+def _persisted_prices(window: int) -> PriceQuotes:
     return fetch_prices()
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+def cached_season() -> SeasonWindow:
+    return _persisted_season(ttl_window(_persisted_season, SEASON_TTL_SECONDS))
+
+
+def cached_prices() -> PriceQuotes:
+    return _persisted_prices(ttl_window(_persisted_prices, PRICES_TTL_SECONDS))
+
+
+@st.cache_data(ttl=USER_DATA_TTL_SECONDS, show_spinner=False, max_entries=128)
 def cached_rewards(username: str) -> List[RewardEntry]:
     return fetch_unclaimed_balance_history(username)
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=USER_DATA_TTL_SECONDS, show_spinner=False, max_entries=128)
 def cached_tournaments(username: str) -> List[TournamentResult]:
-    return fetch_tournaments(username)
+    tournaments = fetch_tournaments(username)
+    # Resolve finishes once at hydration so reruns read t.finish instead of walking players.
+    target = username.lower()
+    for t in tournaments:
+        if t.finish is None:
+            finish_value = _finish_for_target(t, target)
+            if isinstance(finish_value, int):
+                t.finish = finish_value
+    return tournaments
+
+
+# USD totals depend on prices, so this follows the price TTL rather than the user-data one.
+@st.cache_data(ttl=PRICES_TTL_SECONDS, show_spinner=False, max_entries=128)
+def cached_aggregate(season_id: int, username: str) -> AggregatedTotals:
+    """Aggregate one user's season totals; keyed on primitives since the inputs are unhashable."""
+    return aggregate_totals(cached_season(), cached_rewards(username), cached_tournaments(username), cached_prices())
+
+
+@st.cache_data(ttl=USER_DATA_TTL_SECONDS, show_spinner=False, max_entries=128)
+def cached_season_tournaments(season_id: int, username: str) -> List[TournamentResult]:
+    """Tournaments for one user inside the current season, so tab switches skip the date scan."""
+    return filter_tournaments_for_season(cached_tournaments(username), cached_season())
+
+
+SUMMARY_USD_COLUMNS = ["Overall (USD)", "Ranked (USD)", "Brawl (USD)", "Tournament (USD)"]
+
+
+def summary_table_key(per_user_totals: List[tuple[str, AggregatedTotals]]) -> tuple:
+    """Reduce per-user totals to the hashable primitives the summary table is built from."""
+    return tuple(
+        (
+            username,
+            totals.overall.usd,
+            totals.ranked.usd,
+            totals.brawl.usd,
+            totals.tournament.usd,
+            totals.overall.token_amounts.get("SPS", 0),
+        )
+        for username, totals in per_user_totals
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_summary_table(per_user_totals_key: tuple, scholar_pct: float) -> pd.DataFrame:
+    """Per-user USD totals plus scholar/owner shares; cached so unchanged reruns reuse the frame."""
+    columns = list(zip(*per_user_totals_key)) or [()] * 6
+    users, overall, ranked, brawl, tournament, sps = columns
+    share = scholar_pct / 100
+    owner_frac = 1 - share
+    overall_arr = np.asarray(overall, dtype=float)
+    return pd.DataFrame(
+        {
+            "User": list(users),
+            "Overall (USD)": overall_arr,
+            "Ranked (USD)": np.asarray(ranked, dtype=float),
+            "Brawl (USD)": np.asarray(brawl, dtype=float),
+            "Tournament (USD)": np.asarray(tournament, dtype=float),
+            "Scholar share (USD)": overall_arr * share,
+            "Owner share (USD)": overall_arr * owner_frac,
+            "Scholar share (SPS)": np.asarray(sps, dtype=float) * share,
+        }
+    )
+
+
+def fetch_user_bundles(usernames: tuple[str, ...]) -> Dict[str, UserBundle | Exception]:
+    """Fetch rewards + tournaments for every user concurrently through the per-user caches."""
+    return fetch_all_sync(usernames, fetch_rewards=cached_rewards, fetch_user_tournaments=cached_tournaments)
+
+
+def aggregate_user_totals(season_id: int, usernames: List[str]) -> Dict[str, AggregatedTotals | Exception]:
+    """Aggregate already-fetched users on a small thread pool; failures are returned per user."""
+    results: Dict[str, AggregatedTotals | Exception] = {}
+    if not usernames:
+        return results
+    with ThreadPoolExecutor(max_workers=min(AGGREGATE_WORKERS, len(usernames))) as pool:
+        futures = {username: pool.submit(cached_aggregate, season_id, username) for username in usernames}
+        for username, future in futures.items():
+            try:
+                results[username] = future.result()
+            except Exception as exc:
+                results[username] = exc
+    return results
+
+
+class _HistoryFetchFailed(Exception):
+    """Raised inside the cached read so st.cache_data never stores a failed (empty) history."""
+
+
+@st.cache_data(ttl=HISTORY_TTL_SECONDS, show_spinner=False, max_entries=64)
+def _cached_history(username: str) -> List[tuple[Dict[str, object], AggregatedTotals]]:
+    records = fetch_season_history(username)
+    if not records and get_last_supabase_error():
+        raise _HistoryFetchFailed(get_last_supabase_error())
+    records = sorted(records, key=_record_season_id, reverse=True)
+    return [(record, _aggregated_totals_from_record(record)) for record in records]
+
+
+def cached_history(username: str) -> List[tuple[Dict[str, object], AggregatedTotals]]:
+    """Saved season rows for a user, newest first, paired with their parsed totals."""
+    try:
+        return _cached_history(username)
+    except _HistoryFetchFailed:
+        return []
+
+
+def clear_history_cache():
+    _cached_history.clear()  # type: ignore[attr-defined]
 
 
 def clear_caches():
-    cached_season.clear()  # type: ignore[attr-defined]
-    cached_prices.clear()  # type: ignore[attr-defined]
+    _persisted_season.clear()  # type: ignore[attr-defined]
+    _persisted_prices.clear()  # type: ignore[attr-defined]
     cached_rewards.clear()  # type: ignore[attr-defined]
     cached_tournaments.clear()  # type: ignore[attr-defined]
+    cached_aggregate.clear()  # type: ignore[attr-defined]
+    cached_season_tournaments.clear()  # type: ignore[attr-defined]
+    _cached_history.clear()  # type: ignore[attr-defined]
+    build_summary_table.clear()  # type: ignore[attr-defined]
+    with _finish_index_lock:
+        _finish_index_cache.clear()
 
 
 def parse_usernames(raw: str) -> List[str]:
@@ -73,111 +215,132 @@ def _format_price(value) -> str:
         return str(value)
 
 
-def _format_token_amounts_dict(token_amounts, prices) -> str:
+def _case_insensitive_prices(prices) -> Dict[str, float]:
+    """Flatten price quotes into a lower-case token -> USD map so lookups are a single dict probe."""
+    token_to_usd = getattr(prices, "token_to_usd", prices) or {}
+    return {
+        str(token).lower(): float(price)
+        for token, price in token_to_usd.items()
+        if isinstance(price, (int, float))
+    }
+
+
+def _format_token_amounts_dict(token_amounts, prices_ci: Dict[str, float]) -> str:
     if not token_amounts:
         return "-"
-    parts = []
+    price_for = prices_ci.get
+    priced = []
+    zero_count = 0
     for token, amount in token_amounts.items():
-        usd = (prices.get(token) or 0) * amount
-        parts.append(f"{amount:g} {token} (${usd:,.2f})")
+        usd = price_for(token.lower(), 0.0) * amount
+        if usd <= 0:
+            zero_count += 1
+            continue
+        priced.append((usd, token, amount))
+    # Most valuable first; unpriced tokens collapse into a single count.
+    priced.sort(key=lambda item: item[0], reverse=True)
+    parts = [f"{amount:g} {token} (${usd:,.2f})" for usd, token, amount in priced]
+    if zero_count:
+        parts.append(f"(+{zero_count} no-price)")
     return "; ".join(parts)
 
 
-def _format_rewards_list(rewards: List[RewardEntry] | List[TournamentResult], prices) -> str:
+def _format_rewards_list(rewards: List[RewardEntry] | List[TournamentResult], prices_ci: Dict[str, float]) -> str:
     parts = []
+    price_for = prices_ci.get
     for reward in rewards:
-        token = getattr(reward, "token", None) or getattr(reward, "token", None)
-        amount = getattr(reward, "amount", None)
-        if token is None or amount is None:
+        try:
+            token, amount = reward.token, reward.amount
+        except AttributeError:
+            continue
+        if not token or amount is None:
             continue
-        usd = (prices.get(token) or 0) * amount
+        usd = price_for(token.lower(), 0.0) * amount
         parts.append(f"{amount:g} {token.upper()} (${usd:,.2f})")
     return "; ".join(parts) if parts else "-"
 
 
+_BASE_CURRENCY_ORDER = ("SPS", "USD", "ETH", "HIVE", "BTC", "DEC", "VOUCHER")
+_BASE_CURRENCY_SET = frozenset(_BASE_CURRENCY_ORDER)
+
+
 def _build_currency_options(per_user_totals: List[tuple[str, AggregatedTotals]]) -> List[str]:
-    currencies = {"SPS", "USD", "ETH", "HIVE", "BTC", "DEC", "VOUCHER"}
+    extras: set[str] = set()
     for _, totals in per_user_totals:
-        tokens = totals.overall.token_amounts.keys()
-        currencies.update(token.upper() for token in tokens if isinstance(token, str))
-    base_order = ["SPS", "USD", "ETH", "HIVE", "BTC", "DEC", "VOUCHER"]
-    extras = [token for token in sorted(currencies) if token not in base_order]
-    ordered = [token for token in base_order if token in currencies]
-    return ordered + extras
+        for token in totals.overall.token_amounts:
+            if isinstance(token, str):
+                extras.add(token.upper())
+    return list(_BASE_CURRENCY_ORDER) + sorted(extras - _BASE_CURRENCY_SET)
+
+
+def _format_scholar_payouts(
+    currencies: List[str], sps_amounts: np.ndarray, prices_ci: Dict[str, float]
+) -> List[str]:
+    """Format many scholar payouts; the SPS -> USD -> target conversion runs as one numpy pass."""
+    keys = [currency.upper() for currency in currencies]
+    sps_amounts = np.asarray(sps_amounts, dtype=np.float64)
+    usd_values = sps_amounts * prices_ci.get("sps", 0.0)
+    target_prices = np.fromiter((prices_ci.get(key.lower(), 0.0) for key in keys), dtype=np.float64, count=len(keys))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        converted = np.where(target_prices > 0, usd_values / target_prices, 0.0)
+
+    formatted: List[str] = []
+    for key, sps_amount, usd_value, target_price, amount in zip(
+        keys, sps_amounts.tolist(), usd_values.tolist(), target_prices.tolist(), converted.tolist()
+    ):
+        if key == "USD":
+            formatted.append(f"${usd_value:,.2f}")
+        elif key == "SPS":
+            formatted.append(f"{sps_amount:,.2f} SPS (${usd_value:,.2f})")
+        elif sps_amount == 0 or usd_value == 0:
+            formatted.append(f"0.00 {key}")
+        elif not target_price:
+            formatted.append("-")
+        else:
+            formatted.append(f"{amount:,.2f} {key} (${usd_value:,.2f})")
+    return formatted
 
 
 def _format_scholar_payout(
     currency: str,
     totals: AggregatedTotals,
     scholar_pct: float,
-    prices: PriceQuotes,
+    prices_ci: Dict[str, float],
     explicit_sps: float | None = None,
 ) -> str:
-    currency_key = currency.upper()
     if explicit_sps is None:
         sps_amount = totals.overall.token_amounts.get("SPS", 0.0) * (scholar_pct / 100)
     else:
         sps_amount = explicit_sps
-    sps_price = prices.get("SPS") or prices.get("sps") or 0
-    usd_value = sps_amount * sps_price
-
-    if currency_key == "USD":
-        return f"${usd_value:,.2f}"
-    if sps_amount == 0 or usd_value == 0:
-        if currency_key == "SPS":
-            return f"{sps_amount:,.2f} SPS (${usd_value:,.2f})"
-        return f"0.00 {currency_key}"
-    if currency_key == "SPS":
-        return f"{sps_amount:,.2f} SPS (${usd_value:,.2f})"
-
-    target_price = prices.get(currency_key) or prices.get(currency_key.lower())
-    if not target_price:
-        return "-"
-    converted = usd_value / target_price if target_price else 0.0
-    return f"{converted:,.2f} {currency_key} (${usd_value:,.2f})"
+    return _format_scholar_payouts([currency], np.array([sps_amount]), prices_ci)[0]
 
 
 def _safe_float(value: object | None, default: float = 0.0) -> float:
     if value is None:
         return default
-    if isinstance(value, (float, int)):
+    try:
         return float(value)
-    if isinstance(value, str):
-        try:
-            return float(value)
-        except ValueError:
-            return default
-    return default
-
-
-def _safe_int(value: object | None, default: int = 0) -> int:
-    if value is None:
+    except (TypeError, ValueError):
         return default
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return default
-    return default
 
 
 def _try_parse_int(value: object | None) -> int | None:
     if value is None:
         return None
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
+    try:
         return int(value)
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return None
-    return None
+    except (TypeError, ValueError, OverflowError):
+        pass
+    # Strings like "3.0" fail int() directly; route them through float.
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _safe_int(value: object | None, default: int = 0) -> int:
+    parsed = _try_parse_int(value)
+    return default if parsed is None else parsed
 
 
 def _parse_token_amounts(payload: object | None) -> Dict[str, float]:
@@ -185,11 +348,15 @@ def _parse_token_amounts(payload: object | None) -> Dict[str, float]:
         return {}
     if isinstance(payload, str):
         try:
-            payload = json.loads(payload)
+            payload = orjson.loads(payload)
         except Exception:
             return {}
     if not isinstance(payload, dict):
         return {}
+    # Fast path: Supabase jsonb already decodes to str -> number, so skip the per-item error handling.
+    # Always build a fresh dict: the payload belongs to a cached record and must not be handed out.
+    if all(type(k) is str for k in payload) and all(type(v) is float or type(v) is int for v in payload.values()):
+        return {k.upper(): float(v) for k, v in payload.items()}
     tokens: Dict[str, float] = {}
     for token, amount in payload.items():
         try:
@@ -207,11 +374,12 @@ def _category_totals_from_record(record: Dict[str, object], prefix: str) -> Cate
 
 
 def _merge_token_amounts(*parts: Dict[str, float]) -> Dict[str, float]:
-    merged: Dict[str, float] = defaultdict(float)
+    """Sum token dicts whose keys are already upper-cased (see _parse_token_amounts)."""
+    merged: Dict[str, float] = {}
     for part in parts:
         for token, amount in part.items():
-            merged[token.upper()] += amount
-    return dict(merged)
+            merged[token] = merged.get(token, 0.0) + amount
+    return merged
 
 
 def _aggregated_totals_from_record(record: Dict[str, object]) -> AggregatedTotals:
@@ -246,65 +414,131 @@ def _record_season_id(record: Dict[str, object]) -> int:
     return _safe_int(record.get("season_id"))
 
 
+def _rewards_arrays(rewards) -> tuple[np.ndarray, np.ndarray]:
+    """Project token/amount rewards into parallel (upper-case token, amount) arrays."""
+    tokens = np.array([str(r.token).upper() for r in rewards], dtype=object)
+    amounts = np.fromiter((float(r.amount) for r in rewards), dtype=np.float64, count=len(tokens))
+    return tokens, amounts
+
+
 def _sum_rewards_sps(rewards) -> float:
-    return sum(r.amount for r in rewards if getattr(r, "token", "").upper() == "SPS")
+    rewards = [r for r in rewards if getattr(r, "token", None) is not None]
+    if not rewards:
+        return 0.0
+    tokens, amounts = _rewards_arrays(rewards)
+    return float(amounts[tokens == "SPS"].sum())
+
+
+PriceTable = tuple[Dict[str, int], np.ndarray]
+
 
+def _price_table(prices_ci: Dict[str, float]) -> PriceTable:
+    """Split the lower-case price map into a token -> index map and a dense price vector."""
+    token_to_idx = {token: idx for idx, token in enumerate(prices_ci)}
+    prices_vec = np.fromiter(prices_ci.values(), dtype=np.float64, count=len(prices_ci))
+    return token_to_idx, prices_vec
 
-def _sum_rewards_usd(rewards, prices) -> float:
-    total = 0.0
+
+def _sum_by_token(token_ids: np.ndarray, amounts: np.ndarray, prices_vec: np.ndarray) -> tuple[np.ndarray, float]:
+    """Reduce (token id, amount) pairs to per-token sums and their USD total; ids < 0 are unpriced."""
+    mask = token_ids >= 0
+    per_token = np.bincount(token_ids[mask], weights=amounts[mask], minlength=len(prices_vec))
+    return per_token, float(per_token @ prices_vec)
+
+
+def _sum_rewards_usd(rewards, price_table: PriceTable) -> float:
+    token_to_idx, prices_vec = price_table
+    token_rewards = []
     for r in rewards:
         # Handle RewardEntry / TokenAmount objects.
-        token = getattr(r, "token", None)
-        amount = getattr(r, "amount", None)
-        if token is not None and amount is not None:
-            price = prices.get(token) or prices.get(str(token).lower()) or 0
-            total += amount * price
+        if getattr(r, "token", None) is not None and getattr(r, "amount", None) is not None:
+            token_rewards.append((r.token, r.amount))
             continue
 
         # Handle Aggregated/Category totals with token_amounts dict.
         token_amounts = getattr(r, "token_amounts", None)
         if isinstance(token_amounts, dict):
-            for tok, amt in token_amounts.items():
-                price = prices.get(tok) or prices.get(str(tok).lower()) or 0
-                total += amt * price
+            token_rewards.extend(token_amounts.items())
             continue
 
         # Handle TournamentResult objects with rewards list.
         rewards_list = getattr(r, "rewards", None)
         if isinstance(rewards_list, list):
-            for reward in rewards_list:
-                token_inner = getattr(reward, "token", None)
-                amount_inner = getattr(reward, "amount", None)
-                if token_inner is None or amount_inner is None:
-                    continue
-                price = prices.get(token_inner) or prices.get(str(token_inner).lower()) or 0
-                total += amount_inner * price
-    return total
+            token_rewards.extend(
+                (reward.token, reward.amount)
+                for reward in rewards_list
+                if getattr(reward, "token", None) is not None and getattr(reward, "amount", None) is not None
+            )
+
+    if not token_rewards:
+        return 0.0
+    count = len(token_rewards)
+    idx = np.fromiter(
+        (token_to_idx.get(str(tok).lower(), -1) for tok, _ in token_rewards), dtype=np.intp, count=count
+    )
+    amounts = np.fromiter((float(amt) for _, amt in token_rewards), dtype=np.float64, count=count)
+    _, usd = _sum_by_token(idx, amounts, prices_vec)
+    return usd
 
 
-def _get_finish_for_tournament(t: TournamentResult, username: str) -> str | int:
+def _finish_index(t: TournamentResult) -> Dict[str, int]:
+    """Map lower-cased player names to their finish, walking a tournament's players once per id."""
+    with _finish_index_lock:
+        index = _finish_index_cache.get(t.id)
+    if index is not None:
+        return index
+
+    detail = t.raw.get("detail") if isinstance(t.raw, dict) else None
+    players = detail.get("players") if isinstance(detail, dict) else None
+    if not isinstance(players, list):
+        return {}
+    index = {}
+    for p in players:
+        if not isinstance(p, dict):
+            continue
+        finish_value = _try_parse_int(p.get("finish"))
+        if finish_value is None:
+            continue
+        player_name = p.get("player", "")
+        if not isinstance(player_name, str):
+            player_name = str(player_name)
+        index.setdefault(player_name.lower(), finish_value)
+    if not index:
+        # Standings may not be posted yet; look again next time instead of pinning an empty index.
+        return index
+    with _finish_index_lock:
+        _finish_index_cache[t.id] = index
+    return index
+
+
+def _finish_for_target(t: TournamentResult, target: str) -> str | int:
+    """Resolve a finish for an already lower-cased username."""
     if t.finish is not None:
         return t.finish
+    finish_value = _finish_index(t).get(target)
+    if finish_value is not None:
+        return finish_value
     detail = t.raw.get("detail") if isinstance(t.raw, dict) else None
-    target = username.lower()
-    players = detail.get("players") if isinstance(detail, dict) else None
-    if isinstance(players, list):
-        for p in players:
-            if not isinstance(p, dict):
-                continue
-            if str(p.get("player", "")).lower() == target:
-                finish_value = _try_parse_int(p.get("finish"))
-                if finish_value is not None:
-                    return finish_value
-                break
     current_player = detail.get("current_player") if isinstance(detail, dict) else None
-    if isinstance(current_player, dict) and str(current_player.get("player", "")).lower() == target:
-        finish_value = _try_parse_int(current_player.get("finish"))
-        if finish_value is not None:
-            return finish_value
+    if isinstance(current_player, dict):
+        player_name = current_player.get("player")
+        if isinstance(player_name, str) and player_name.lower() == target:
+            finish_value = _try_parse_int(current_player.get("finish"))
+            if finish_value is not None:
+                return finish_value
     return "-"
 
 
+def _get_finish_for_tournament(t: TournamentResult, username: str) -> str | int:
+    return _finish_for_target(t, username.lower())
+
+
+def _build_finish_index(tournaments: List[TournamentResult], username: str) -> Dict[str, str | int]:
+    """Map tournament id -> finish for one user in a single pass, lower-casing the username once."""
+    target = username.lower()
+    return {t.id: _finish_for_target(t, target) for t in tournaments}
+
+
 def _render_user_summary(username: str, totals: AggregatedTotals, scholar_pct: float) -> None:
     st.markdown(
         f"<div style='font-size:16px; font-weight:600; font-family:inherit;'>{username}</div>",
@@ -0,0 +1 @@
+"""Tournament series feature helpers and services."""
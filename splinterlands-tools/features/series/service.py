@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from scholar_helper.services.storage import (
+    fetch_point_schemes,
+    fetch_series_configs,
+    fetch_tournament_events_supabase,
+    fetch_tournament_ingest_organizers,
+    fetch_tournament_results_supabase,
+    get_last_supabase_error,
+)
+
+# Organizer lists, saved configs and point schemes barely change within a session.
+REFERENCE_TTL_SECONDS = 300
+# Events and results follow ingest, so keep them fresh enough for the refresh flow.
+RESULTS_TTL_SECONDS = 60
+
+
+class _FetchFailed(Exception):
+    """Raised inside a cached fetch so st.cache_data never stores a failed (empty) result."""
+
+
+def _checked(rows):
+    # Storage fetchers return [] on failure and record the reason; raising keeps that out of the cache.
+    if not rows and get_last_supabase_error():
+        raise _FetchFailed(get_last_supabase_error())
+    return rows
+
+
+@st.cache_data(ttl=REFERENCE_TTL_SECONDS, show_spinner=False)
+def _cached_organizers() -> List[str]:
+    return _checked(fetch_tournament_ingest_organizers())
+
+
+@st.cache_data(ttl=REFERENCE_TTL_SECONDS, show_spinner=False, max_entries=128)
+def _cached_configs(username: str) -> List[Dict]:
+    return _checked(fetch_series_configs(username))
+
+
+@st.cache_data(ttl=REFERENCE_TTL_SECONDS, show_spinner=False)
+def _cached_schemes() -> List[Dict]:
+    return _checked(fetch_point_schemes())
+
+
+def cached_organizers() -> List[str]:
+    try:
+        return _cached_organizers()
+    except _FetchFailed:
+        return []
+
+
+def cached_configs(username: str) -> List[Dict]:
+    try:
+        return _cached_configs(username)
+    except _FetchFailed:
+        return []
+
+
+def cached_schemes() -> List[Dict]:
+    try:
+        return _cached_schemes()
+    except _FetchFailed:
+        return []
+
+
+@st.cache_data(ttl=RESULTS_TTL_SECONDS, show_spinner=False, max_entries=128)
+def _cached_events(
+    organizer: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 200,
+) -> List[Dict]:
+    return _checked(fetch_tournament_events_supabase(organizer, limit=limit, since=since, until=until))
+
+
+@st.cache_data(ttl=RESULTS_TTL_SECONDS, show_spinner=False, max_entries=128)
+def _cached_results(
+    tournament_ids: Tuple[str, ...],
+    organizer: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[Dict]:
+    return _checked(
+        fetch_tournament_results_supabase(
+            tournament_ids=list(tournament_ids),
+            organizer=organizer,
+            since=since,
+            until=until,
+        )
+    )
+
+
+@st.cache_data(ttl=RESULTS_TTL_SECONDS, show_spinner=False, max_entries=256)
+def _cached_event_results(tournament_id: str) -> List[Dict]:
+    return _checked(fetch_tournament_results_supabase(tournament_id))
+
+
+def cached_events(
+    organizer: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = 200,
+) -> List[Dict]:
+    try:
+        return _cached_events(organizer, since=since, until=until, limit=limit)
+    except _FetchFailed:
+        return []
+
+
+def cached_results(
+    tournament_ids: Tuple[str, ...],
+    organizer: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[Dict]:
+    """Result rows for a set of events; pass ``event_ids_key()`` so reordering does not miss the cache."""
+    try:
+        return _cached_results(tournament_ids, organizer=organizer, since=since, until=until)
+    except _FetchFailed:
+        return []
+
+
+def cached_event_results(tournament_id: str) -> List[Dict]:
+    try:
+        return _cached_event_results(tournament_id)
+    except _FetchFailed:
+        return []
+
+
+def event_ids_key(event_ids) -> Tuple[str, ...]:
+    return tuple(sorted(str(tid) for tid in event_ids if tid))
+
+
+SERIES_TOTALS_COLUMNS = ["Player", "Points", "Events", "Avg Finish", "Best", "Podiums"]
+
+
+def aggregate_series_totals(result_rows: List[Dict], points_key: str) -> pd.DataFrame:
+    """Per-player series totals from result rows, sorted by points (ties keep first-seen order)."""
+    if not result_rows:
+        return pd.DataFrame(columns=SERIES_TOTALS_COLUMNS)
+    df = pd.DataFrame.from_records(result_rows)
+    players = df["player"] if "player" in df else pd.Series("", index=df.index)
+    df["Player"] = players.fillna("").astype(str).str.strip()
+    df = df[df["Player"] != ""]
+    points = df[points_key] if points_key in df else pd.Series(0.0, index=df.index)
+    finishes = df["finish"] if "finish" in df else pd.Series(None, index=df.index, dtype=float)
+    df = df.assign(
+        pts=pd.to_numeric(points, errors="coerce").fillna(0.0),
+        fin=pd.to_numeric(finishes, errors="coerce"),
+    )
+    df["podium"] = df["fin"].between(1, 3)
+    totals = df.groupby("Player", sort=False).agg(
+        Points=("pts", "sum"),
+        Events=("pts", "size"),
+        Avg_Finish=("fin", "mean"),
+        Best=("fin", "min"),
+        Podiums=("podium", "sum"),
+    )
+    totals = totals.rename(columns={"Avg_Finish": "Avg Finish"}).reset_index()
+    return totals.sort_values("Points", ascending=False, kind="stable").reset_index(drop=True)[SERIES_TOTALS_COLUMNS]
+
+
+def event_results_frame(leaderboard: List[Dict], points_key: str) -> pd.DataFrame:
+    """Single-event results table (finish, player, points, prizes) built column by column."""
+    return pd.DataFrame(
+        {
+            "Finish": [row.get("finish") for row in leaderboard],
+            "Player": [row.get("player") for row in leaderboard],
+            "Points": pd.to_numeric(pd.Series([row.get(points_key) for row in leaderboard], dtype=object), errors="coerce"),
+            "Prizes": [row.get("prize_text") for row in leaderboard],
+        }
+    )
+
+
+def clear_caches():
+    _cached_organizers.clear()  # type: ignore[attr-defined]
+    _cached_configs.clear()  # type: ignore[attr-defined]
+    _cached_schemes.clear()  # type: ignore[attr-defined]
+    _cached_events.clear()  # type: ignore[attr-defined]
+    _cached_results.clear()  # type: ignore[attr-defined]
+    _cached_event_results.clear()  # type: ignore[attr-defined]
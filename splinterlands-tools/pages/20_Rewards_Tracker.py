@@ -1,35 +1,39 @@
 from __future__ import annotations
 
 from typing import Dict, List
+import pandas as pd
 import streamlit as st
 
 from core.config import render_footer, setup_page
 from features.scholar.service import (
-    aggregate_totals,
+    SUMMARY_USD_COLUMNS,
+    PriceTable,
+    aggregate_user_totals,
+    build_summary_table,
     cached_prices,
-    cached_rewards,
     cached_season,
+    cached_season_tournaments,
     cached_tournaments,
     clear_caches,
-    fetch_season_history,
-    filter_tournaments_for_season,
+    cached_history,
+    clear_history_cache,
+    fetch_user_bundles,
     get_supabase_client,
     parse_usernames,
+    summary_table_key,
     update_season_currency,
-    _aggregated_totals_from_record,
     _build_currency_options,
+    _build_finish_index,
+    _case_insensitive_prices,
     _format_price,
-    _format_scholar_payout,
+    _format_scholar_payouts,
     _format_token_amounts_dict,
-    _get_finish_for_tournament,
-    _merge_token_amounts,
-    _parse_token_amounts,
+    _price_table,
     _record_scholar_pct,
     _record_season_id,
-    _safe_float,
     _sum_rewards_usd,
 )
-from scholar_helper.models import AggregatedTotals, CategoryTotals, RewardEntry, TournamentResult
+from scholar_helper.models import AggregatedTotals, RewardEntry, TournamentResult
 
 
 setup_page("Rewards Tracker")
@@ -60,6 +64,180 @@ def _token_amounts_from_rewards(rewards) -> dict[str, float]:
     return tokens
 
 
+HISTORY_TABLE_COLUMNS = [
+    "Season",
+    "Ranked tokens",
+    "Tournament tokens",
+    "Brawl tokens",
+    "Overall tokens",
+    "Scholar payout",
+    "Currency",
+]
+TOURNAMENT_ROW_COLUMNS = ["Tournament", "Start", "Finish", "Prize", "Entry fee", "Prize (USD)"]
+
+
+def _iter_tournament_rows(tournaments, username: str, prices_ci: dict[str, float], price_table: PriceTable):
+    """Yield one display tuple per tournament the user finished, in TOURNAMENT_ROW_COLUMNS order."""
+    finish_map = _build_finish_index(tournaments, username)
+    for t in tournaments:
+        finish_value = finish_map.get(t.id, "-")
+        if finish_value in (None, "-"):
+            continue
+        rewards = getattr(t, "rewards", None)
+        yield (
+            t.name or t.raw.get("title", "-"),
+            t.start_date.date() if t.start_date else "-",
+            finish_value,
+            _format_token_amounts_dict(_token_amounts_from_rewards(rewards), prices_ci),
+            _format_token_amounts_dict(_entry_fee_to_tokens(getattr(t, "entry_fee", None)), prices_ci),
+            _sum_rewards_usd(t.rewards, price_table),
+        )
+
+
+@st.fragment
+def _render_per_user_section(
+    per_user_totals: List[tuple[str, AggregatedTotals]], scholar_mode: bool, prices_ci: dict[str, float]
+) -> None:
+    """Per-user and scholar share tables; a fragment so share/currency edits skip the data reload."""
+    scholar_pct = (
+        st.number_input("Scholar share (%)", min_value=0, max_value=100, value=0, step=5)
+        if scholar_mode
+        else 0
+    )
+    st.markdown("### Per-user totals")
+    summary_df = build_summary_table(summary_table_key(per_user_totals), scholar_pct)
+    per_user_df = summary_df[["User", *SUMMARY_USD_COLUMNS]]
+    st.dataframe(
+        per_user_df,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "Overall (USD)": st.column_config.NumberColumn(format="%.2f"),
+            "Ranked (USD)": st.column_config.NumberColumn(format="%.2f"),
+            "Brawl (USD)": st.column_config.NumberColumn(format="%.2f"),
+            "Tournament (USD)": st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
+
+    if scholar_mode:
+        currency_key = tuple(tuple(totals.overall.token_amounts) for _, totals in per_user_totals)
+        if st.session_state.get("_currency_options_key") != currency_key:
+            st.session_state["_currency_options_key"] = currency_key
+            st.session_state["_currency_options"] = _build_currency_options(per_user_totals)
+        currency_options = st.session_state["_currency_options"]
+        st.markdown("#### Scholar payout currency per account")
+        selector_columns_count = max(1, min(2, len(per_user_totals)))
+        selector_columns = st.columns(selector_columns_count)
+        default_currency_idx = currency_options.index("SPS") if "SPS" in currency_options else 0
+        currency_choices: dict[int, str] = {}
+        for idx, (username, _) in enumerate(per_user_totals):
+            selection_column = selector_columns[idx % selector_columns_count]
+            currency_choices[idx] = selection_column.selectbox(
+                f"{username} payout currency",
+                options=currency_options,
+                key=f"scholar_payout_currency_{idx}_{username}",
+                index=default_currency_idx,
+            )
+
+        st.markdown("#### Scholar + owner share table")
+        default_currency = currency_options[default_currency_idx]
+        # The summary table already holds each scholar's SPS share; reuse it instead of
+        # re-deriving scholar_pct / 100 per user, and convert every row in one numpy pass.
+        payout_display = _format_scholar_payouts(
+            [currency_choices.get(idx, default_currency) for idx in range(len(per_user_totals))],
+            summary_df["Scholar share (SPS)"].to_numpy(),
+            prices_ci,
+        )
+        share_df = summary_df.assign(**{"Scholar payout": payout_display})
+        st.dataframe(
+            share_df,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Overall (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Ranked (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Brawl (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Tournament (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Scholar share (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Owner share (USD)": st.column_config.NumberColumn(format="%.2f"),
+                "Scholar share (SPS)": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+
+
+@st.fragment
+def _render_tournament_lookup(
+    default_username: str, season, prices_ci: dict[str, float], price_table: PriceTable
+) -> None:
+    """Tournament tab body; a fragment so lookups rerun without touching the summary tab."""
+    st.markdown("### Tournament lookup")
+    lookup_username = st.text_input("Tournament username", value=default_username).strip()
+    if lookup_username:
+        with st.spinner(f"Loading tournaments for {lookup_username}..."):
+            user_tournaments = cached_tournaments(lookup_username)
+            for t in user_tournaments:
+                setattr(t, "username", lookup_username)
+        if not user_tournaments:
+            st.info("No tournaments found for that user.")
+        else:
+            tournaments_this_season = cached_season_tournaments(season.id, lookup_username)
+            tournament_df = pd.DataFrame.from_records(
+                _iter_tournament_rows(tournaments_this_season, lookup_username, prices_ci, price_table),
+                columns=TOURNAMENT_ROW_COLUMNS,
+            )
+            if not tournament_df.empty:
+                total_prize_usd = float(tournament_df["Prize (USD)"].sum())
+                st.metric("Total tournament earnings (USD est)", f"${total_prize_usd:,.2f}")
+                st.dataframe(
+                    tournament_df.drop(columns=["Prize (USD)"]),
+                    hide_index=True,
+                    width="stretch",
+                    column_config={
+                        "Prize": st.column_config.TextColumn("Prize"),
+                        "Entry fee": st.column_config.TextColumn("Entry fee"),
+                    },
+                )
+            else:
+                st.info("No tournaments for this user in the current season.")
+    else:
+        st.info("Enter a username to view tournament history.")
+
+
+@st.fragment
+def _render_currency_updates(
+    records: list[dict], normalized_history_username: str, history_currency_options: list[str], feedback_key: str
+) -> None:
+    """Payout currency editors; a fragment so selectbox changes rerun only this block."""
+    st.markdown("#### Update payout currency")
+    for idx, record in enumerate(records):
+        stored_currency = str(record.get("payout_currency") or "SPS")
+        default_currency = stored_currency if stored_currency in history_currency_options else history_currency_options[0]
+        selection_key = f"history_currency_{normalized_history_username.lower()}_{_record_season_id(record)}_{idx}"
+        cols = st.columns([1.5, 1.5, 2, 1])
+        cols[0].markdown(f"**Season {_record_season_id(record)}**")
+        cols[1].markdown(f"{record.get('season_start') or '-'} → {record.get('season_end') or '-'}")
+        selected_currency = cols[2].selectbox(
+            "Payout currency",
+            options=history_currency_options,
+            key=selection_key,
+            index=history_currency_options.index(default_currency),
+        )
+        save_key = f"history_save_{normalized_history_username.lower()}_{_record_season_id(record)}_{idx}"
+        if cols[3].button("Save currency", key=save_key):
+            if update_season_currency(
+                normalized_history_username, _record_season_id(record), selected_currency
+            ):
+                clear_history_cache()
+                if feedback_key:
+                    st.session_state[feedback_key] = (
+                        f"Scholar payout currency updated to {selected_currency} for season {_record_season_id(record)}."
+                    )
+                # Full-app rerun so the history table above picks up the saved currency.
+                st.rerun(scope="app")
+            else:
+                cols[3].error("Failed to update the payout currency; check your database configuration.")
+
+
 def render_page():
     st.title("Rewards Tracker")
     st.caption("Account-centric rewards. Toggle Scholar mode for payout tools and history.")
@@ -70,22 +248,25 @@ def render_page():
     except Exception as exc:
         st.error(f"Failed to load base data: {exc}")
         return
+    prices_ci = _case_insensitive_prices(prices)
+    price_table = _price_table(prices_ci)
 
     price_tokens = ["USD", "SPS", "DEC", "ETH", "HIVE", "BTC", "VOUCHER"]
-    price_rows = []
+    price_displays = []
     for token in price_tokens:
         if token.upper() == "USD":
             display = "$1.00"
         else:
-            price = prices.get(token.lower())
+            price = prices_ci.get(token.lower())
             display = _format_price(price) if price is not None else "-"
-        price_rows.append({"Currency": token, "USD price": display})
+        price_displays.append(display)
+    price_df = pd.DataFrame({"Currency": price_tokens, "USD price": price_displays})
     with st.sidebar:
         st.subheader("Mode")
         scholar_mode = st.toggle("Scholar mode", value=False, help="Enable scholar payouts/history")
         st.subheader("Prices")
         st.dataframe(
-            price_rows,
+            price_df,
             hide_index=True,
             column_config={
                 "Currency": st.column_config.TextColumn(),
@@ -103,152 +284,84 @@ def render_page():
     tab_history = tabs[2] if scholar_mode else None
 
     with tab_summary:
-        col1, col2, col3 = st.columns([2, 1, 1])
+        col1, col2 = st.columns([3, 1])
         with col1:
             usernames_raw = st.text_input("Usernames (comma separated)", value="")
         with col2:
-            scholar_pct = (
-                st.number_input("Scholar share (%)", min_value=0, max_value=100, value=0, step=5)
-                if scholar_mode
-                else 0
-            )
-        with col3:
             refresh_clicked = st.button("Refresh now")
 
         if refresh_clicked:
             clear_caches()
             st.rerun()
 
-        usernames = parse_usernames(usernames_raw)
+        if st.session_state.get("_usernames_raw") != usernames_raw:
+            st.session_state["_usernames_raw"] = usernames_raw
+            st.session_state["_usernames_parsed"] = parse_usernames(usernames_raw)
+        usernames = st.session_state["_usernames_parsed"]
 
         per_user_totals: List[tuple[str, AggregatedTotals]] = []
         reward_rows: List[RewardEntry] = []
         tournament_rows: List[TournamentResult] = []
         user_tournaments_by_user: Dict[str, List[TournamentResult]] = {}
-        currency_choices: Dict[int, str] = {}
-        default_currency = "SPS"
-        currency_options: List[str] = ["SPS"]
+
+        user_bundles = {}
+        if usernames:
+            with st.spinner(f"Fetching data for {', '.join(usernames)}..."):
+                user_bundles = fetch_user_bundles(tuple(usernames))
 
         for username in usernames:
-            with st.spinner(f"Fetching data for {username}..."):
-                try:
-                    user_rewards = cached_rewards(username)
-                    user_tournaments = cached_tournaments(username)
-                except Exception as exc:
-                    st.warning(f"Failed to fetch data for {username}: {exc}")
-                    continue
-
-                # Attach username to results for downstream display.
-                for reward in user_rewards:
-                    if not hasattr(reward, "username"):
-                        setattr(reward, "username", username)
-                for tournament in user_tournaments:
-                    if not hasattr(tournament, "username"):
-                        setattr(tournament, "username", username)
-
-                reward_rows.extend(user_rewards)
-                tournament_rows.extend(user_tournaments)
-                user_tournaments_by_user[username] = user_tournaments
-
-                try:
-                    totals = aggregate_totals(season, user_rewards, user_tournaments, prices)
-                    per_user_totals.append((username, totals))
-                except Exception as exc:
-                    st.warning(f"Failed to aggregate data for {username}: {exc}")
+            bundle = user_bundles.get(username)
+            if isinstance(bundle, Exception) or bundle is None:
+                st.warning(f"Failed to fetch data for {username}: {bundle}")
+                continue
+            user_rewards, user_tournaments = bundle
+
+            # Attach username to results for downstream display.
+            for reward in user_rewards:
+                if not hasattr(reward, "username"):
+                    setattr(reward, "username", username)
+            for tournament in user_tournaments:
+                if not hasattr(tournament, "username"):
+                    setattr(tournament, "username", username)
+
+            reward_rows.extend(user_rewards)
+            tournament_rows.extend(user_tournaments)
+            user_tournaments_by_user[username] = user_tournaments
+
+        aggregated = aggregate_user_totals(season.id, list(user_tournaments_by_user))
+        for username, totals in aggregated.items():
+            if isinstance(totals, Exception):
+                st.warning(f"Failed to aggregate data for {username}: {totals}")
+                continue
+            per_user_totals.append((username, totals))
 
         if not reward_rows and not tournament_rows:
             st.info("No data found yet. Try adding usernames.")
             return
 
-        combined_totals: AggregatedTotals = aggregate_totals(season, reward_rows, tournament_rows, prices)
+        combined_totals: AggregatedTotals = sum(
+            (totals for _, totals in per_user_totals), AggregatedTotals.empty()
+        )
 
         if per_user_totals:
-            st.markdown("### Per-user totals")
-            per_user_rows = []
-            for username, totals in per_user_totals:
-                per_user_rows.append(
-                    {
-                        "User": username,
-                        "Overall (USD)": totals.overall.usd,
-                        "Ranked (USD)": totals.ranked.usd,
-                        "Brawl (USD)": totals.brawl.usd,
-                        "Tournament (USD)": totals.tournament.usd,
-                    }
-                )
-            st.dataframe(
-                per_user_rows,
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "Overall (USD)": st.column_config.NumberColumn(format="%.2f"),
-                    "Ranked (USD)": st.column_config.NumberColumn(format="%.2f"),
-                    "Brawl (USD)": st.column_config.NumberColumn(format="%.2f"),
-                    "Tournament (USD)": st.column_config.NumberColumn(format="%.2f"),
-                },
-            )
-
-            if scholar_mode:
-                currency_options = _build_currency_options(per_user_totals)
-                st.markdown("#### Scholar payout currency per account")
-                selector_columns_count = max(1, min(2, len(per_user_totals)))
-                selector_columns = st.columns(selector_columns_count)
-                default_currency_idx = currency_options.index("SPS") if "SPS" in currency_options else 0
-                currency_choices: dict[int, str] = {}
-                for idx, (username, _) in enumerate(per_user_totals):
-                    selection_column = selector_columns[idx % selector_columns_count]
-                    currency_choices[idx] = selection_column.selectbox(
-                        f"{username} payout currency",
-                        options=currency_options,
-                        key=f"scholar_payout_currency_{idx}_{username}",
-                        index=default_currency_idx,
-                    )
-
-                st.markdown("#### Scholar + owner share table")
-                default_currency = currency_options[default_currency_idx]
-                table_rows = []
-                for idx, (username, user_totals) in enumerate(per_user_totals):
-                    scholar_share_usd = user_totals.overall.usd * (scholar_pct / 100)
-                    owner_share_usd = user_totals.overall.usd - scholar_share_usd
-                    scholar_share_sps = user_totals.overall.token_amounts.get("SPS", 0) * (scholar_pct / 100)
-                    selected_currency = currency_choices.get(idx, default_currency)
-                    payout_display = _format_scholar_payout(selected_currency, user_totals, scholar_pct, prices)
-                    table_rows.append(
-                        {
-                            "User": username,
-                            "Overall (USD)": user_totals.overall.usd,
-                            "Ranked (USD)": user_totals.ranked.usd,
-                            "Brawl (USD)": user_totals.brawl.usd,
-                            "Tournament (USD)": user_totals.tournament.usd,
-                            "Scholar share (USD)": scholar_share_usd,
-                            "Owner share (USD)": owner_share_usd,
-                            "Scholar share (SPS)": scholar_share_sps,
-                            "Scholar payout": payout_display,
-                        }
-                    )
-                st.dataframe(
-                    table_rows,
-                    width="stretch",
-                    hide_index=True,
-                    column_config={
-                        "Overall (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Ranked (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Brawl (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Tournament (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Scholar share (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Owner share (USD)": st.column_config.NumberColumn(format="%.2f"),
-                        "Scholar share (SPS)": st.column_config.NumberColumn(format="%.2f"),
-                    },
-                )
+            _render_per_user_section(per_user_totals, scholar_mode, prices_ci)
 
         st.markdown("### Rewards by source (all users, season)")
-        source_rows = [
-            {"Source": "Ranked", "USD (est)": combined_totals.ranked.usd, "Tokens": _format_token_amounts_dict(combined_totals.ranked.token_amounts, prices)},
-            {"Source": "Brawl", "USD (est)": combined_totals.brawl.usd, "Tokens": _format_token_amounts_dict(combined_totals.brawl.token_amounts, prices)},
-            {"Source": "Tournament", "USD (est)": combined_totals.tournament.usd, "Tokens": _format_token_amounts_dict(combined_totals.tournament.token_amounts, prices)},
-            {"Source": "Entry fees (tracking)", "USD (est)": combined_totals.entry_fees.usd, "Tokens": _format_token_amounts_dict(combined_totals.entry_fees.token_amounts, prices)},
+        source_buckets = [
+            ("Ranked", combined_totals.ranked),
+            ("Brawl", combined_totals.brawl),
+            ("Tournament", combined_totals.tournament),
+            ("Entry fees (tracking)", combined_totals.entry_fees),
         ]
+        source_df = pd.DataFrame(
+            {
+                "Source": [label for label, _ in source_buckets],
+                "USD (est)": [bucket.usd for _, bucket in source_buckets],
+                "Tokens": [_format_token_amounts_dict(bucket.token_amounts, prices_ci) for _, bucket in source_buckets],
+            }
+        )
         st.dataframe(
-            source_rows,
+            source_df,
             width="stretch",
             hide_index=True,
             column_config={
@@ -257,56 +370,7 @@ def render_page():
         )
 
     with tab_tournaments:
-        st.markdown("### Tournament lookup")
-        lookup_username = st.text_input(
-            "Tournament username", value=(usernames[0] if usernames else "")
-        )
-        if lookup_username.strip():
-            with st.spinner(f"Loading tournaments for {lookup_username}..."):
-                user_tournaments = cached_tournaments(lookup_username)
-                for t in user_tournaments:
-                    setattr(t, "username", lookup_username)
-            if not user_tournaments:
-                st.info("No tournaments found for that user.")
-            else:
-                tournaments_this_season = filter_tournaments_for_season(user_tournaments, season)
-                display_rows = []
-                total_prize_usd = 0.0
-                for t in tournaments_this_season:
-                    finish_value = _get_finish_for_tournament(t, lookup_username)
-                    if finish_value in (None, "-"):
-                        continue
-                    usd_value = _sum_rewards_usd(t.rewards, prices)
-                    total_prize_usd += usd_value
-                    tournament_name = t.name or t.raw.get("title", "-")
-                    display_rows.append(
-                        {
-                            "Tournament": tournament_name,
-                            "Start": t.start_date.date() if t.start_date else "-",
-                            "Finish": finish_value,
-                            "Prize": _format_token_amounts_dict(
-                                _token_amounts_from_rewards(getattr(t, "rewards", None)), prices
-                            ),
-                            "Entry fee": _format_token_amounts_dict(
-                                _entry_fee_to_tokens(getattr(t, "entry_fee", None)), prices
-                            ),
-                        }
-                    )
-                if display_rows:
-                    st.metric("Total tournament earnings (USD est)", f"${total_prize_usd:,.2f}")
-                    st.dataframe(
-                        display_rows,
-                        hide_index=True,
-                        width="stretch",
-                        column_config={
-                            "Prize": st.column_config.TextColumn("Prize"),
-                            "Entry fee": st.column_config.TextColumn("Entry fee"),
-                        },
-                    )
-                else:
-                    st.info("No tournaments for this user in the current season.")
-        else:
-            st.info("Enter a username to view tournament history.")
+        _render_tournament_lookup(usernames[0] if usernames else "", season, prices_ci, price_table)
 
     if scholar_mode and tab_history is not None:
         with tab_history:
@@ -329,13 +393,13 @@ def render_page():
                     return
 
                 with st.spinner("Loading history from the database..."):
-                    records = fetch_season_history(normalized_history_username)
-                if not records:
+                    history_entries = cached_history(normalized_history_username)
+                if not history_entries:
                     st.info("No season history found for that user.")
                     return
 
-                filtered_records: list[dict] = []
-                for rec in records:
+                filtered_entries: list[tuple[dict, AggregatedTotals]] = []
+                for rec, rec_totals in history_entries:
                     usernames_field = rec.get("username") or rec.get("usernames")
                     names: list[str] = []
                     if isinstance(usernames_field, str):
@@ -343,59 +407,53 @@ def render_page():
                     elif isinstance(usernames_field, list):
                         names = [str(n).strip().lower() for n in usernames_field if str(n).strip()]
                     if not names or normalized_history_username in names:
-                        filtered_records.append(rec)
+                        filtered_entries.append((rec, rec_totals))
 
-                if not filtered_records:
+                if not filtered_entries:
                     st.info("No history rows match this username after filtering mixed-user records.")
                     return
-                records = filtered_records
 
-                history_records_sorted = sorted(records, key=_record_season_id, reverse=True)
-                history_table_rows = []
-                for idx, record in enumerate(history_records_sorted):
+                history_records_sorted = [rec for rec, _ in filtered_entries]
+                history_columns: Dict[str, list] = {column: [] for column in HISTORY_TABLE_COLUMNS}
+                payout_currencies: List[str] = []
+                payout_sps: List[float] = []
+                for record, totals in filtered_entries:
                     season_label = record.get("season") or record.get("season_id") or "-"
-                    scholar_pct = _record_scholar_pct(record)
-                    totals = _aggregated_totals_from_record(record)
-
                     payout_currency = record.get("payout_currency")
                     scholar_payout_value = record.get("scholar_payout")
                     if scholar_payout_value is not None:
-                        sps_price = prices.get("SPS") or prices.get("sps") or 0
-                        payout_display = f"{scholar_payout_value:,.2f} SPS (${scholar_payout_value * sps_price:,.2f})"
+                        # A stored payout is always shown in SPS.
+                        payout_currencies.append("SPS")
+                        payout_sps.append(float(scholar_payout_value))
                     else:
-                        payout_display = _format_scholar_payout(
-                            str(payout_currency or "SPS"),
-                            totals,
-                            scholar_pct,
-                            prices,
+                        payout_currencies.append(str(payout_currency or "SPS"))
+                        payout_sps.append(
+                            totals.overall.token_amounts.get("SPS", 0.0) * (_record_scholar_pct(record) / 100)
                         )
 
-                    history_table_rows.append(
-                        {
-                            "Season": season_label,
-                            "Ranked tokens": _format_token_amounts_dict(
-                                totals.ranked.token_amounts, prices
-                            ),
-                            "Tournament tokens": _format_token_amounts_dict(
-                                totals.tournament.token_amounts, prices
-                            ),
-                            "Brawl tokens": _format_token_amounts_dict(
-                                totals.brawl.token_amounts, prices
-                            ),
-                            "Overall tokens": _format_token_amounts_dict(
-                                totals.overall.token_amounts, prices
-                            ),
-                            "Scholar payout": payout_display,
-                            "Currency": payout_currency,
-                        }
+                    history_columns["Season"].append(season_label)
+                    history_columns["Ranked tokens"].append(
+                        _format_token_amounts_dict(totals.ranked.token_amounts, prices_ci)
                     )
+                    history_columns["Tournament tokens"].append(
+                        _format_token_amounts_dict(totals.tournament.token_amounts, prices_ci)
+                    )
+                    history_columns["Brawl tokens"].append(
+                        _format_token_amounts_dict(totals.brawl.token_amounts, prices_ci)
+                    )
+                    history_columns["Overall tokens"].append(
+                        _format_token_amounts_dict(totals.overall.token_amounts, prices_ci)
+                    )
+                    history_columns["Currency"].append(payout_currency)
 
-                if history_table_rows:
+                history_columns["Scholar payout"] = _format_scholar_payouts(payout_currencies, payout_sps, prices_ci)
+                history_df = pd.DataFrame(history_columns)
+                if not history_df.empty:
                     with st.expander("Raw rows (debug)", expanded=False):
                         st.json(history_records_sorted)
 
                     st.dataframe(
-                        history_table_rows,
+                        history_df,
                         width="stretch",
                         hide_index=True,
                         column_config={
@@ -406,75 +464,12 @@ def render_page():
                         },
                     )
 
-                    st.markdown("#### Update payout currency")
-                    for idx, record in enumerate(history_records_sorted[:2]):
-                        stored_currency = str(record.get("payout_currency") or "SPS")
-                        default_currency = stored_currency if stored_currency in history_currency_options else history_currency_options[0]
-                        selection_key = f"history_currency_{normalized_history_username.lower()}_{_record_season_id(record)}_{idx}"
-                        cols = st.columns([1.5, 1.5, 2, 1])
-                        cols[0].markdown(f"**Season {_record_season_id(record)}**")
-                        cols[1].markdown(f"{record.get('season_start') or '-'} → {record.get('season_end') or '-'}")
-                        selected_currency = cols[2].selectbox(
-                            "Payout currency",
-                            options=history_currency_options,
-                            key=selection_key,
-                            index=history_currency_options.index(default_currency),
-                        )
-                        save_key = f"history_save_{normalized_history_username.lower()}_{_record_season_id(record)}_{idx}"
-                        if cols[3].button("Save currency", key=save_key):
-                            if update_season_currency(
-                                normalized_history_username, _record_season_id(record), selected_currency
-                            ):
-                                if feedback_key:
-                                    st.session_state[feedback_key] = (
-                                        f"Scholar payout currency updated to {selected_currency} for season {_record_season_id(record)}."
-                                    )
-                                st.experimental_rerun()  # type: ignore[attr-defined]
-                            else:
-                                cols[3].error("Failed to update the payout currency; check your database configuration.")
-
-
-def _merge_tournament_records(tournament_lists, season: int) -> list[dict]:
-    merged: list[dict] = []
-    for tournaments in tournament_lists:
-        for tournament in tournaments:
-            if tournament.season != season:
-                continue
-            merged.append(tournament.raw or {})
-    return merged
-
-
-def _aggregate_history_record(record, prices) -> AggregatedTotals:
-    ranked = CategoryTotals(
-        token_amounts=_parse_token_amounts(record.get("ranked_tokens")),
-        usd=_safe_float(record.get("ranked_usd")),
-    )
-    brawl = CategoryTotals(
-        token_amounts=_parse_token_amounts(record.get("brawl_tokens")),
-        usd=_safe_float(record.get("brawl_usd")),
-    )
-    tournament = CategoryTotals(
-        token_amounts=_parse_token_amounts(record.get("tournament_tokens")),
-        usd=_safe_float(record.get("tournament_usd")),
-    )
-    entry_fees = CategoryTotals(
-        token_amounts=_parse_token_amounts(record.get("entry_fees_tokens")),
-        usd=_safe_float(record.get("entry_fees_usd")),
-    )
-    overall_tokens = _merge_token_amounts(
-        ranked.token_amounts, brawl.token_amounts, tournament.token_amounts, entry_fees.token_amounts
-    )
-    overall_usd = _safe_float(record.get("overall_usd"))
-    if not overall_usd:
-        overall_usd = _sum_rewards_usd([ranked, brawl, tournament], prices) - entry_fees.usd
-
-    return AggregatedTotals(
-        ranked=ranked,
-        brawl=brawl,
-        tournament=tournament,
-        entry_fees=entry_fees,
-        overall=CategoryTotals(token_amounts=overall_tokens, usd=overall_usd),
-    )
+                    _render_currency_updates(
+                        history_records_sorted[:2],
+                        normalized_history_username,
+                        history_currency_options,
+                        feedback_key,
+                    )
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ except ImportError:
 
     def get_last_supabase_error() -> str:  # type: ignore
         return "Helper not available"
+from features.series.service import clear_caches
 from series import leaderboard, tournament
 
 
@@ -38,6 +39,7 @@ def render_page() -> None:
             with st.spinner("Refreshing organizer tournaments (3 days)..."):
                 ok = refresh_tournament_ingest_all(max_age_days=3)
             if ok:
+                clear_caches()
                 st.success("Tournament data refresh kicked off.")
             else:
                 st.error(f"Failed to trigger refresh: {get_last_supabase_error() or 'Unknown error'}")
@@ -82,6 +82,13 @@ class CategoryTotals:
     token_amounts: Dict[str, float] = field(default_factory=dict)
     usd: float = 0.0
 
+    def __add__(self, other: "CategoryTotals") -> "CategoryTotals":
+        """Merge two buckets; totals are plain sums so they can be folded instead of re-aggregated."""
+        merged = dict(self.token_amounts)
+        for token, amount in other.token_amounts.items():
+            merged[token] = merged.get(token, 0.0) + amount
+        return CategoryTotals(token_amounts=merged, usd=self.usd + other.usd)
+
 
 @dataclass
 class AggregatedTotals:
@@ -91,6 +98,25 @@ class AggregatedTotals:
     entry_fees: CategoryTotals
     overall: CategoryTotals
 
+    @classmethod
+    def empty(cls) -> "AggregatedTotals":
+        return cls(
+            ranked=CategoryTotals(),
+            brawl=CategoryTotals(),
+            tournament=CategoryTotals(),
+            entry_fees=CategoryTotals(),
+            overall=CategoryTotals(),
+        )
+
+    def __add__(self, other: "AggregatedTotals") -> "AggregatedTotals":
+        return AggregatedTotals(
+            ranked=self.ranked + other.ranked,
+            brawl=self.brawl + other.brawl,
+            tournament=self.tournament + other.tournament,
+            entry_fees=self.entry_fees + other.entry_fees,
+            overall=self.overall + other.overall,
+        )
+
 
 def _parse_timestamp(value: object) -> datetime:
     """Parse an ISO-8601 timestamp string into an aware UTC datetime."""
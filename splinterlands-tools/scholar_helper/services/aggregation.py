@@ -62,15 +62,8 @@ def aggregate_totals(
     tournament_totals = _sum_token_amounts(tournament_reward_tokens, prices, lambda t: (t.token, t.amount))
     entry_fee_totals = _sum_token_amounts(entry_fees, prices, lambda f: (f.token, f.amount))
 
-    overall_tokens: Dict[str, float] = defaultdict(float)
-    for bucket in (ranked_totals, brawl_totals, tournament_totals):
-        for token, amount in bucket.token_amounts.items():
-            overall_tokens[token] += amount
-
-    overall_usd = sum(
-        (prices.get(token) or 0) * amount for token, amount in overall_tokens.items()
-    )
-    overall_totals = CategoryTotals(token_amounts=dict(overall_tokens), usd=overall_usd)
+    # Pricing is linear per token, so overall is the bucket sum; no second pricing pass needed.
+    overall_totals = ranked_totals + brawl_totals + tournament_totals
 
     return AggregatedTotals(
         ranked=ranked_totals,
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 import httpx
 from cachetools import TTLCache, cached
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx (httpx[http2] extra)
+except ImportError:  # pragma: no cover - fall back to HTTP/1.1 keep-alive
+    h2 = None
 
 from scholar_helper.models import (
     HostedTournament,
@@ -20,10 +25,19 @@ from scholar_helper.models import (
 logger = logging.getLogger(__name__)
 
 HTTP_TIMEOUT = 20.0
+DETAIL_FETCH_WORKERS = 8
 
-_client = httpx.Client(timeout=HTTP_TIMEOUT)
+# Detail fan-out threads share this client; over HTTP/2 they multiplex on one connection per host.
+_client = httpx.Client(
+    timeout=HTTP_TIMEOUT,
+    http2=h2 is not None,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+# One pool for every caller: per-user fetches run in parallel threads, and a pool per call would
+# multiply the request burst against the API by the number of users.
+_detail_pool = ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS, thread_name_prefix="tournament-detail")
 _settings_cache = TTLCache(maxsize=16, ttl=300)
-_prices_cache = TTLCache(maxsize=16, ttl=300)
+_prices_cache = TTLCache(maxsize=16, ttl=60)
 _hosted_tournaments_cache = TTLCache(maxsize=64, ttl=300)
 
 
@@ -201,13 +215,28 @@ def fetch_tournaments(username: str, limit: int | None = 200) -> List[Tournament
     if limit and limit > 0:
         filtered = filtered[:limit]
 
+    candidates: List[tuple[Dict[str, object], datetime]] = []
     for raw in filtered:
-        entry_fee = _parse_entry_fee(raw.get("entry_fee"))
         start_dt = _parse_dt(raw.get("start_date"))
         if start_dt and start_dt > future_cutoff:
             continue
+        candidates.append((raw, start_dt))
 
-        detail = _fetch_tournament_detail(raw.get("id"), username)
+    # Detail lookups are independent IO; fetch them concurrently over the shared client.
+    details: List[Optional[Dict[str, object]]] = list(
+        _detail_pool.map(lambda candidate: _fetch_tournament_detail(candidate[0].get("id"), username), candidates)
+    )
+    failed = sum(1 for (raw, _), detail in zip(candidates, details) if raw.get("id") and detail is None)
+    if failed:
+        logger.warning(
+            "Tournament details unavailable for %d of %d tournaments for %s; rewards and finishes may be incomplete",
+            failed,
+            len(candidates),
+            username,
+        )
+
+    for (raw, start_dt), detail in zip(candidates, details):
+        entry_fee = _parse_entry_fee(raw.get("entry_fee"))
         finish = _extract_player_finish(detail, username)
         # Prefer detail payload for dates/entry_fee if present.
         if isinstance(detail, dict):
@@ -430,8 +459,9 @@ def _fetch_tournament_detail(tournament_id: object, username: str) -> Optional[D
         payload = resp.json()
         if isinstance(payload, dict):
             return payload
-    except Exception:
-        logger.debug("Failed to fetch tournament detail for %s", tournament_id, exc_info=True)
+    except Exception as exc:
+        # 429s land here too; the caller reports how many details were lost.
+        logger.warning("Failed to fetch tournament detail for %s: %s", tournament_id, exc)
     return None
 
 
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+from scholar_helper.models import RewardEntry, TournamentResult
+from scholar_helper.services.api import fetch_tournaments, fetch_unclaimed_balance_history
+
+UserBundle = Tuple[List[RewardEntry], List[TournamentResult]]
+RewardsFetcher = Callable[[str], List[RewardEntry]]
+TournamentsFetcher = Callable[[str], List[TournamentResult]]
+
+
+async def fetch_user_bundle(
+    username: str,
+    fetch_rewards: RewardsFetcher = fetch_unclaimed_balance_history,
+    fetch_user_tournaments: TournamentsFetcher = fetch_tournaments,
+) -> UserBundle:
+    """Fetch rewards and tournaments for one user in parallel."""
+    rewards, tournaments = await asyncio.gather(
+        asyncio.to_thread(fetch_rewards, username),
+        asyncio.to_thread(fetch_user_tournaments, username),
+    )
+    return rewards, tournaments
+
+
+async def fetch_all(
+    usernames: Iterable[str],
+    fetch_rewards: RewardsFetcher = fetch_unclaimed_balance_history,
+    fetch_user_tournaments: TournamentsFetcher = fetch_tournaments,
+) -> Dict[str, Union[UserBundle, Exception]]:
+    """
+    Fetch bundles for every user concurrently.
+
+    Failures are returned in place of the bundle so one bad username does not sink the batch.
+    """
+    names = list(usernames)
+    results = await asyncio.gather(
+        *(fetch_user_bundle(name, fetch_rewards, fetch_user_tournaments) for name in names),
+        return_exceptions=True,
+    )
+    return dict(zip(names, results))
+
+
+def fetch_all_sync(
+    usernames: Iterable[str],
+    fetch_rewards: RewardsFetcher = fetch_unclaimed_balance_history,
+    fetch_user_tournaments: TournamentsFetcher = fetch_tournaments,
+) -> Dict[str, Union[UserBundle, Exception]]:
+    """Blocking wrapper around fetch_all for Streamlit pages and scripts."""
+    return asyncio.run(fetch_all(usernames, fetch_rewards, fetch_user_tournaments))
@@ -2,66 +2,109 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import requests
 import pandas as pd
 import streamlit as st
 from difflib import SequenceMatcher
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from scholar_helper.services.disk_cache import ttl_window
 
 API_BASE = "https://api.splinterlands.com"
 DEFAULT_GUILD_ID = "9780675dc7e05224af937c37b30c3812d4e2ca30"
+# Brawl detail lookups are network-bound, so fetch them side by side.
+DETAIL_FETCH_WORKERS = 8
+HTTP_POOL_CONNECTIONS = 10
+# Sized above DETAIL_FETCH_WORKERS so concurrent detail fetches never wait on a socket.
+HTTP_POOL_MAXSIZE = 20
+# Raw API responses are also kept on disk so a restarted process skips the re-fetch within the TTL.
+API_TTL_SECONDS = 300
+_REQUIRED_COLS = ("cycle", "tournament_id", "wins", "losses", "draws", "pts", "brawl_rank")
+_RECORD_COLS = ["wins", "losses", "draws"]
+_MONEY_COLS = ("total_merits_payout", "member_merits_payout", "total_sps_payout")
+
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """One pooled session per process so API calls reuse keep-alive TLS connections."""
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=512)
+def _persisted_api_json(path: str, params: tuple[tuple[str, str], ...], window: int) -> dict:
+    """GET an API path and return its JSON body; errors raise, so they are never persisted."""
+    resp = _http_session().get(f"{API_BASE}{path}", params=dict(params), timeout=15)
+    resp.raise_for_status()
+    return resp.json() or {}
+
+
+def _api_json(path: str, **params: str) -> dict:
+    return _persisted_api_json(
+        path, tuple(sorted(params.items())), ttl_window(_persisted_api_json, API_TTL_SECONDS)
+    )
 
 
 @st.cache_data(ttl=300)
 def fetch_guild_brawls(guild_id: str) -> pd.DataFrame:
-    resp = requests.get(f"{API_BASE}/guilds/brawl_records", params={"guild_id": guild_id}, timeout=15)
-    resp.raise_for_status()
-    data = resp.json() or {}
+    data = _api_json("/guilds/brawl_records", guild_id=guild_id)
     results = data.get("results", []) or []
     if not results:
         return pd.DataFrame()
     df = pd.DataFrame(results)
-    for col in [
-        "cycle",
-        "tournament_id",
-        "wins",
-        "losses",
-        "draws",
-        "pts",
-        "brawl_rank",
-    ]:
-        if col not in df.columns:
-            df[col] = 0
+    missing = [col for col in _REQUIRED_COLS if col not in df.columns]
+    if missing:
+        df[missing] = 0
     if "created_date" in df.columns:
         df["created_date"] = pd.to_datetime(df["created_date"], errors="coerce")
-    if "cycle" in df.columns:
-        df = df.sort_values("cycle", ascending=False)
-    for col in ["total_merits_payout", "member_merits_payout", "total_sps_payout"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    # "cycle" is always present at this point (filled above when missing).
+    df = df.sort_values("cycle", ascending=False)
+    present_money = [col for col in _MONEY_COLS if col in df.columns]
+    if present_money:
+        df[present_money] = df[present_money].apply(pd.to_numeric, errors="coerce")
     return df
 
 
 @st.cache_data(ttl=300)
 def fetch_brawl_details(tournament_id: str, guild_id: str) -> dict:
-    resp = requests.get(
-        f"{API_BASE}/tournaments/find_brawl",
-        params={"id": tournament_id, "guild_id": guild_id},
-        timeout=15,
-    )
-    resp.raise_for_status()
-    return resp.json() or {}
+    return _api_json("/tournaments/find_brawl", id=tournament_id, guild_id=guild_id)
 
 
 def build_player_rows(guild_id: str, history: pd.DataFrame, max_brawls: int = 40) -> pd.DataFrame:
     if history.empty:
         return pd.DataFrame()
-    cycles = sorted(history["cycle"].dropna().unique(), reverse=True)[:max_brawls]
+    # The API may send cycles as strings; nlargest needs a numeric dtype.
+    cycle_values = pd.to_numeric(history["cycle"], errors="coerce")
+    # nlargest keeps the top-N cycles without a full sort and without assuming history order.
+    cycles = cycle_values.dropna().drop_duplicates().nlargest(max_brawls)
+    selected = history.assign(cycle=cycle_values)[cycle_values.isin(frozenset(cycles.tolist()))]
+    # One detail fetch per brawl: a repeated id would re-dispatch the cache and double-count players.
+    selected = selected.drop_duplicates("tournament_id")
+    brawls = [
+        (tournament_id, int(cycle) if not pd.isna(cycle) else None)
+        for tournament_id, cycle in zip(selected["tournament_id"].to_numpy(), selected["cycle"].to_numpy())
+    ]
+    if not brawls:
+        return pd.DataFrame()
+    with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(brawls))) as pool:
+        futures = [
+            (tournament_id, cycle, pool.submit(fetch_brawl_details, tournament_id, guild_id))
+            for tournament_id, cycle in brawls
+        ]
     rows = []
-    for _, row in history[history["cycle"].isin(cycles)].iterrows():
-        tournament_id = row["tournament_id"]
-        cycle = int(row["cycle"]) if not pd.isna(row["cycle"]) else None
+    # Collect in history order so the frame matches the sequential version.
+    for tournament_id, cycle, future in futures:
         try:
-            details = fetch_brawl_details(tournament_id, guild_id)
+            details = future.result()
         except Exception:
             continue
         players = details.get("players", [])
@@ -77,14 +120,42 @@ def build_player_rows(guild_id: str, history: pd.DataFrame, max_brawls: int = 40
                     "cycle": cycle,
                     "tournament_id": tournament_id,
                     "player": name,
-                    "wins": int(record.get("wins", 0)),
-                    "losses": int(record.get("losses", 0)),
-                    "draws": int(record.get("draws", 0)),
+                    "wins": record.get("wins", 0),
+                    "losses": record.get("losses", 0),
+                    "draws": record.get("draws", 0),
                 }
             )
     if not rows:
         return pd.DataFrame()
-    return pd.DataFrame(rows)
+    df = pd.DataFrame(rows)
+    # One vectorized cast instead of three int() calls per player row.
+    df[_RECORD_COLS] = (
+        df[_RECORD_COLS].apply(pd.to_numeric, errors="coerce").fillna(0).astype(np.int32)
+    )
+    return df
+
+
+def _reduce_player_records(
+    player_codes: np.ndarray,
+    tournament_codes: np.ndarray,
+    wins: np.ndarray,
+    losses: np.ndarray,
+    draws: np.ndarray,
+    n_players: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-player win/loss/draw sums and distinct brawl counts from factorized codes (-1 = missing)."""
+    valid = player_codes >= 0
+    codes = player_codes[valid]
+
+    def _sum(values: np.ndarray) -> np.ndarray:
+        return np.bincount(codes, weights=values[valid], minlength=n_players).astype(np.int64)
+
+    # Distinct (player, brawl) pairs, folded into one int64 key, then counted per player.
+    paired = valid & (tournament_codes >= 0)
+    n_tournaments = int(tournament_codes.max()) + 1 if len(tournament_codes) else 0
+    pair_keys = np.unique(player_codes[paired].astype(np.int64) * n_tournaments + tournament_codes[paired])
+    brawls_played = np.bincount(pair_keys // max(n_tournaments, 1), minlength=n_players)
+    return _sum(wins), _sum(losses), _sum(draws), brawls_played
 
 
 def compute_player_stats(players_df: pd.DataFrame, window: int = 5) -> pd.DataFrame:
@@ -95,25 +166,30 @@ def compute_player_stats(players_df: pd.DataFrame, window: int = 5) -> pd.DataFr
     window_rows = players_df[players_df["cycle"].isin(window_cycles)]
     if window_rows.empty:
         return pd.DataFrame()
-    agg = (
-        window_rows.groupby("player")
-        .agg(
-            wins=("wins", "sum"),
-            losses=("losses", "sum"),
-            draws=("draws", "sum"),
-            matches=("wins", "sum"),
-        )
-        .reset_index()
+    player_codes, players = pd.factorize(window_rows["player"], sort=False)
+    tournament_codes, _ = pd.factorize(window_rows["tournament_id"], sort=False)
+    counts = {col: window_rows[col].to_numpy(np.int64) for col in _RECORD_COLS}
+    wins, losses, draws, brawls_played = _reduce_player_records(
+        player_codes, tournament_codes, counts["wins"], counts["losses"], counts["draws"], len(players)
+    )
+    matches = wins + losses + draws
+    agg = pd.DataFrame(
+        {
+            "player": players,
+            "wins": wins,
+            "losses": losses,
+            "draws": draws,
+            "matches": matches,
+            "win_rate": np.divide(wins, matches, out=np.zeros(len(players)), where=matches > 0),
+            "brawls_played": brawls_played,
+        }
     )
-    agg["matches"] = agg["wins"] + agg["losses"] + agg["draws"]
-    agg["win_rate"] = agg["wins"] / agg["matches"].replace(0, 1)
-    agg["brawls_played"] = window_rows.groupby("player")["tournament_id"].nunique().values
     return agg
 
 
 @st.cache_data(ttl=86400)
 def fetch_guild_list() -> list[dict]:
-    resp = requests.get(f"{API_BASE}/guilds/list", timeout=20)
+    resp = _http_session().get(f"{API_BASE}/guilds/list", timeout=20)
     resp.raise_for_status()
     data = resp.json() or {}
     guilds = data.get("guilds") or []
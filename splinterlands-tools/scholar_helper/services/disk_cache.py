@@ -0,0 +1,24 @@
+"""Helpers for Streamlit caches persisted to disk."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict
+
+_persisted_windows: Dict[str, int] = {}
+
+
+def ttl_window(persisted_func, ttl_seconds: int) -> int:
+    """
+    Return the current TTL window index for a disk-persisted cache.
+
+    Streamlit ignores ``ttl`` when ``persist="disk"``, so the window index is passed as part of the
+    cache key instead; entries from the previous window are dropped when it rolls over.
+    """
+    window = int(time.time() // ttl_seconds)
+    name = f"{persisted_func.__module__}.{persisted_func.__qualname__}"
+    previous = _persisted_windows.get(name)
+    if previous is not None and previous != window:
+        persisted_func.clear()
+    _persisted_windows[name] = window
+    return window
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 import logging
-from typing import Dict, Iterable, Optional, Sequence
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Sequence
 from datetime import datetime, timezone
+from decimal import Decimal
 
+from cachetools import LRUCache
 from dotenv import load_dotenv
+import orjson
 import requests
-try:
-    import streamlit as st
-except Exception:  # Streamlit not available in pure CLI runs (e.g., tests)
-    st = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Reuse Streamlit only when the app has already loaded it; CLI syncs and tests never pay its import.
+st = sys.modules.get("streamlit")
 
 from scholar_helper.models import AggregatedTotals, SeasonWindow, TournamentResult
 
@@ -21,23 +33,103 @@ TOURNAMENT_RESULTS_TABLE = "tournament_results"
 TOURNAMENT_ORGANIZERS_TABLE = "tournament_ingest_organizers"
 SERIES_CONFIGS_TABLE = "series_configs"
 
+# Keep each PostgREST write well under the server-side statement timeout.
+PGRST_BATCH_SIZE = 500
+# Tournament log rows carry the full API payload in "raw", so they go out in smaller requests.
+TOURNAMENT_LOG_BATCH_SIZE = 100
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+# Concurrent upsert batches; kept below the pool size so every POST reuses a pooled socket.
+UPSERT_WORKERS = 4
+# No count preference: PostgREST only knows count=exact|planned|estimated and skips counting when none is sent.
+UPSERT_PREFER = "resolution=merge-duplicates,return=minimal"
+# Cap on error response text kept in messages and logs.
+ERROR_BODY_CHARS = 2048
+
 logger = logging.getLogger(__name__)
 
-_last_error: Optional[str] = None
+# Per-context last error: each Streamlit session thread (and CLI run) sees only its own failures.
+_last_error: ContextVar[Optional[str]] = ContextVar("supabase_last_error", default=None)
+_credentials: Optional[tuple[str, str]] = None
+# Last (ETag, rows) per season-history endpoint, replayed when the server answers 304 Not Modified.
+_history_etags: LRUCache = LRUCache(maxsize=256)
+_history_etags_lock = threading.Lock()
+
+# Shared with core/config.py so .env is parsed at most once per process.
+_ENV_LOADED_FLAG = "_SL_TOOLS_ENV_LOADED"
+
+
+def _ensure_env_loaded() -> None:
+    if not os.environ.get(_ENV_LOADED_FLAG):
+        load_dotenv()
+        os.environ[_ENV_LOADED_FLAG] = "1"
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    # PostgREST upserts (merge-duplicates) and PATCHes are idempotent, so POST/PATCH are safe to retry.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST", "PATCH"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One pooled session shared across reruns and users so Supabase calls reuse keep-alive connections.
+if st is not None:
+    _http_session = st.cache_resource(show_spinner=False)(_build_http_session)
+else:
+    _http_session = lru_cache(maxsize=1)(_build_http_session)
+
 
-load_dotenv()
+def reset_supabase_cache() -> None:
+    """Forget memoized credentials and prebuilt headers (tests, or after rotating keys)."""
+    global _credentials
+    _credentials = None
+    _build_auth_headers.cache_clear()
+    _upsert_headers.cache_clear()
+    with _history_etags_lock:
+        _history_etags.clear()
+
+
+def _streamlit_secrets():
+    """Streamlit secrets (parsed once by Streamlit itself), importing Streamlit only on this fallback."""
+    if st is not None:
+        return st.secrets
+    if importlib.util.find_spec("streamlit") is None:
+        return None
+    import streamlit
+
+    return streamlit.secrets
 
 
 def _get_supabase_credentials() -> Optional[tuple[str, str]]:
-    """Return (url, key) using env first, then Streamlit secrets."""
+    """
+    Return (url, key) using env first, then Streamlit secrets.
+
+    The first successful lookup is memoized; misses are not, so a missing secret can still be
+    fixed without a restart.
+    """
+    global _credentials
+    if _credentials is not None:
+        return _credentials
+    _ensure_env_loaded()
     url = os.getenv("SUPABASE_URL")
     key = (
         os.getenv("SUPABASE_SERVICE_ROLE_KEY")
         or os.getenv("SUPABASE_SERVICE_KEY")
         or os.getenv("SUPABASE_ANON_KEY")
     )
-    if (not url or not key) and st is not None:
-        secrets = st.secrets
+    secrets = _streamlit_secrets() if not url or not key else None
+    if secrets is not None:
         url = url or secrets.get("SUPABASE_URL")
         key = (
             key
@@ -47,7 +139,8 @@ def _get_supabase_credentials() -> Optional[tuple[str, str]]:
         )
     if not url or not key:
         return None
-    return url, key
+    _credentials = (url, key)
+    return _credentials
 
 
 def get_supabase_client() -> Optional[tuple[str, str]]:
@@ -57,33 +150,65 @@ def get_supabase_client() -> Optional[tuple[str, str]]:
     We return credentials instead of a Supabase client to avoid dependency conflicts on Streamlit
     Cloud. The upsert helpers below use the REST API directly via requests.
     """
-    global _last_error
     creds = _get_supabase_credentials()
     if not creds:
-        _last_error = "Missing SUPABASE_URL or key"
+        _set_last_error("Missing SUPABASE_URL or key")
         return None
-    _last_error = None
+    _set_last_error(None)
     return creds
 
 
 def get_last_supabase_error() -> Optional[str]:
-    return _last_error
+    return _last_error.get()
 
 
-def _postgrest_upsert(url: str, key: str, table: str, rows) -> None:
-    global _last_error
-    headers = {
-        "apikey": key,
-        "Authorization": f"Bearer {key}",
-        "Content-Type": "application/json",
-        "Prefer": "resolution=merge-duplicates,return=minimal",
-    }
-    resp = requests.post(f"{url}/rest/v1/{table}", json=rows, headers=headers, timeout=15)
+def _set_last_error(message: Optional[str]) -> Optional[str]:
+    _last_error.set(message)
+    return message
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_body(payload) -> bytes:
+    """orjson-encode a request body; numpy scalars/arrays stay numeric and Decimals become floats."""
+    return orjson.dumps(
+        payload,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def _postgrest_upsert(url: str, key: str, table: str, rows) -> Optional[str]:
+    """POST one upsert batch; returns the error message on failure (also set as this context's last error)."""
+    try:
+        resp = _http_session().post(
+            f"{url}/rest/v1/{table}",
+            data=_json_body(rows),
+            headers=_upsert_headers(key),
+            timeout=15,
+        )
+    except requests.RequestException as exc:
+        error = _set_last_error(f"Supabase upsert failed: {exc}")
+        logger.error(error)
+        return error
     if resp.status_code >= 300:
-        _last_error = f"Supabase upsert failed: {resp.status_code} {resp.text}"
+        return _set_last_error(f"Supabase upsert failed: {resp.status_code} {resp.text[:ERROR_BODY_CHARS]}")
+    return None
+
 
+@lru_cache(maxsize=4)
+def _upsert_headers(key: str) -> Dict[str, str]:
+    """Upsert headers, built once per key; requests merges them into a fresh dict per call."""
+    return {**_build_auth_headers(key, "application/json"), "Prefer": UPSERT_PREFER}
 
+
+@lru_cache(maxsize=8)
 def _build_auth_headers(key: str, content_type: str | None = None) -> Dict[str, str]:
+    """Auth headers per (key, content type), built once; callers must not mutate the shared dict."""
     headers = {
         "apikey": key,
         "Authorization": f"Bearer {key}",
@@ -95,27 +220,26 @@ def _build_auth_headers(key: str, content_type: str | None = None) -> Dict[str,
 
 def _supabase_fetch(path: str, params: Dict[str, object] | None = None) -> list[Dict[str, object]]:
     """Lightweight GET helper for Supabase REST endpoints/views."""
-    global _last_error
     creds = get_supabase_client()
     if creds is None:
         return []
 
     url, key = creds
     try:
-        resp = requests.get(
+        resp = _http_session().get(
             f"{url}/rest/v1/{path}",
             headers=_build_auth_headers(key),
             params=params or {},
             timeout=20,
         )
     except Exception as exc:
-        _last_error = f"Supabase fetch failed: {exc}"
-        logger.error(_last_error)
+        error = _set_last_error(f"Supabase fetch failed: {exc}")
+        logger.error(error)
         return []
 
     if resp.status_code >= 300:
-        _last_error = f"Supabase fetch failed: {resp.status_code} {resp.text[:512]}"
-        logger.error(_last_error)
+        error = _set_last_error(f"Supabase fetch failed: {resp.status_code} {resp.text[:512]}")
+        logger.error(error)
         return []
 
     data = resp.json() or []
@@ -135,20 +259,19 @@ def refresh_tournament_ingest_all(max_age_days: int = 3) -> bool:
     url, key = creds
     payload = {"max_age_days": max_age_days}
     try:
-        resp = requests.post(
+        resp = _http_session().post(
             f"{url}/rest/v1/rpc/refresh_tournament_ingest",
             headers=_build_auth_headers(key, "application/json"),
             json=payload,
             timeout=60,
         )
     except Exception as exc:
-        global _last_error
-        _last_error = f"Ingest trigger failed: {exc}"
-        logger.error(_last_error)
+        error = _set_last_error(f"Ingest trigger failed: {exc}")
+        logger.error(error)
         return False
     if resp.status_code >= 300:
-        _last_error = f"Ingest trigger failed: {resp.status_code} {resp.text[:512]}"
-        logger.error(_last_error)
+        error = _set_last_error(f"Ingest trigger failed: {resp.status_code} {resp.text[:512]}")
+        logger.error(error)
         return False
     return True
 
@@ -163,88 +286,169 @@ def _to_iso(dt: datetime | str | None) -> Optional[str]:
     return dt.isoformat()
 
 
-def upsert_season_totals(
+def _is_empty_totals(totals: AggregatedTotals) -> bool:
+    """True when a season has nothing to record (no tokens in any bucket and no USD value)."""
+    buckets = (totals.ranked, totals.brawl, totals.tournament, totals.entry_fees, totals.overall)
+    return all(not bucket.token_amounts and not bucket.usd for bucket in buckets)
+
+
+# Rows may carry datetimes directly: orjson encodes them as RFC 3339, matching isoformat().
+def _season_totals_row(
     season: SeasonWindow,
     username: str,
     totals: AggregatedTotals,
     scholar_pct: float,
     payout_currency: str,
-    table: str = SEASON_TABLE,
-) -> None:
-    creds = get_supabase_client()
-    if creds is None:
-        return
-
-    payload = {
+) -> Dict[str, object]:
+    ranked, brawl, tournament, fees = totals.ranked, totals.brawl, totals.tournament, totals.entry_fees
+    return {
         "season_id": season.id,
-        "season_start": season.starts.isoformat(),
-        "season_end": season.ends.isoformat(),
+        "season_start": season.starts,
+        "season_end": season.ends,
         "username": username,
-        "ranked_tokens": totals.ranked.token_amounts,
-        "brawl_tokens": totals.brawl.token_amounts,
-        "tournament_tokens": totals.tournament.token_amounts,
-        "entry_fees_tokens": totals.entry_fees.token_amounts,
-        "ranked_usd": totals.ranked.usd,
-        "brawl_usd": totals.brawl.usd,
-        "tournament_usd": totals.tournament.usd,
-        "entry_fees_usd": totals.entry_fees.usd,
+        "ranked_tokens": ranked.token_amounts,
+        "brawl_tokens": brawl.token_amounts,
+        "tournament_tokens": tournament.token_amounts,
+        "entry_fees_tokens": fees.token_amounts,
+        "ranked_usd": ranked.usd,
+        "brawl_usd": brawl.usd,
+        "tournament_usd": tournament.usd,
+        "entry_fees_usd": fees.usd,
         "overall_usd": totals.overall.usd,
         "scholar_pct": scholar_pct,
         "payout_currency": payout_currency,
     }
-    url, key = creds
-    _postgrest_upsert(url, key, table, payload)
 
 
-def upsert_tournament_logs(
-    tournaments: Iterable[TournamentResult], username: str, table: str = TOURNAMENT_TABLE
+def _tournament_log_row(t: TournamentResult, username: str) -> Dict[str, object]:
+    entry_fee = t.entry_fee
+    return {
+        "username": username,
+        "tournament_id": t.id,
+        "name": t.name,
+        "start_date": t.start_date,
+        "finish": t.finish,
+        "entry_fee_token": entry_fee.token if entry_fee else None,
+        "entry_fee_amount": entry_fee.amount if entry_fee else None,
+        "rewards": [{"token": r.token, "amount": r.amount} for r in t.rewards],
+        "raw": t.raw,
+    }
+
+
+def _upsert_batched(
+    table: str, rows: Iterable[Dict[str, object]], batch_size: int = PGRST_BATCH_SIZE
 ) -> None:
-    creds = get_supabase_client()
-    if creds is None:
-        return
+    """
+    Upsert rows in bounded batches so large syncs stay under the PostgREST request cap.
 
-    rows = []
-    for t in tournaments:
-        rows.append(
-            {
-                "username": username,
-                "tournament_id": t.id,
-                "name": t.name,
-                "start_date": t.start_date.isoformat() if t.start_date else None,
-                "finish": t.finish,
-                "entry_fee_token": t.entry_fee.token if t.entry_fee else None,
-                "entry_fee_amount": t.entry_fee.amount if t.entry_fee else None,
-                "rewards": [r.__dict__ for r in t.rewards],
-                "raw": t.raw,
-            }
-        )
-    if rows:
-        url, key = creds
-        _postgrest_upsert(url, key, table, rows)
+    Rows are pulled from the iterable one batch at a time and POSTed concurrently over the shared
+    session, with at most UPSERT_WORKERS batches in flight. Merge-duplicate upserts make ordering
+    irrelevant. Failures are collected per batch so one bad batch does not hide the others.
+    """
+    iterator = iter(rows)
+    creds = None
+    errors: list[str] = []
+    batches = 0
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as pool:
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                break
+            if creds is None:
+                creds = get_supabase_client()
+                if creds is None:
+                    return
+            url, key = creds
+            if len(pending) >= UPSERT_WORKERS:
+                error = pending.popleft().result()
+                if error:
+                    errors.append(error)
+            pending.append(pool.submit(_postgrest_upsert, url, key, table, chunk))
+            batches += 1
+        for future in pending:
+            error = future.result()
+            if error:
+                errors.append(error)
+
+    # Workers run in their own contexts, so the submitting context records the outcome.
+    if len(errors) == 1 and batches == 1:
+        _set_last_error(errors[0])
+    elif errors:
+        message = _set_last_error(f"{len(errors)} of {batches} upsert batches failed; first: {errors[0]}")
+        logger.error(message)
+
+
+def upsert_season_totals_many(
+    entries: Iterable[tuple[SeasonWindow, str, AggregatedTotals]],
+    scholar_pct: float,
+    payout_currency: str,
+    table: str = SEASON_TABLE,
+) -> None:
+    """Upsert season totals for several users in a single request."""
+    rows = [
+        _season_totals_row(season, username, totals, scholar_pct, payout_currency)
+        for season, username, totals in entries
+        if not _is_empty_totals(totals)
+    ]
+    _upsert_batched(table, rows)
 
 
-def upsert_tournament_events(events: Sequence[Dict[str, object]]) -> None:
+def upsert_season_totals(
+    season: SeasonWindow,
+    username: str,
+    totals: AggregatedTotals,
+    scholar_pct: float,
+    payout_currency: str,
+    table: str = SEASON_TABLE,
+) -> None:
+    if _is_empty_totals(totals):
+        return
     creds = get_supabase_client()
     if creds is None:
         return
 
-    if not events:
-        return
-
     url, key = creds
-    _postgrest_upsert(url, key, TOURNAMENT_EVENTS_TABLE, events)
+    _postgrest_upsert(url, key, table, _season_totals_row(season, username, totals, scholar_pct, payout_currency))
 
 
-def upsert_tournament_results(results: Sequence[Dict[str, object]]) -> None:
-    creds = get_supabase_client()
-    if creds is None:
-        return
+def upsert_tournament_logs_many(
+    entries: Iterable[tuple[str, Iterable[TournamentResult]]], table: str = TOURNAMENT_TABLE
+) -> None:
+    """Upsert tournament logs for several users, streaming rows into batched requests."""
+    _upsert_batched(table, _unique_tournament_log_rows(entries), TOURNAMENT_LOG_BATCH_SIZE)
 
-    if not results:
-        return
 
-    url, key = creds
-    _postgrest_upsert(url, key, TOURNAMENT_RESULTS_TABLE, results)
+def _unique_tournament_log_rows(
+    entries: Iterable[tuple[str, Iterable[TournamentResult]]]
+) -> Iterator[Dict[str, object]]:
+    """
+    Yield one row per (username, tournament id), skipping repeats before they are serialized.
+
+    A repeated key inside one batch also makes Postgres reject the merge-duplicates upsert.
+    """
+    seen_ids: set[tuple[str, str]] = set()
+    for username, tournaments in entries:
+        for t in tournaments:
+            row_key = (username, t.id)
+            if row_key in seen_ids:
+                continue
+            seen_ids.add(row_key)
+            yield _tournament_log_row(t, username)
+
+
+def upsert_tournament_logs(
+    tournaments: Iterable[TournamentResult], username: str, table: str = TOURNAMENT_TABLE
+) -> None:
+    upsert_tournament_logs_many([(username, tournaments)], table)
+
+
+def upsert_tournament_events(events: Sequence[Dict[str, object]]) -> None:
+    _upsert_batched(TOURNAMENT_EVENTS_TABLE, events)
+
+
+def upsert_tournament_results(results: Sequence[Dict[str, object]]) -> None:
+    _upsert_batched(TOURNAMENT_RESULTS_TABLE, results)
 
 
 def fetch_tournament_events_supabase(
@@ -375,18 +579,27 @@ def fetch_season_history(username: str) -> list[Dict[str, object]]:
     )
     logger.debug("Fetching season history: %s headers=apikey", endpoint)
     headers = _build_auth_headers(key)
-    resp = requests.get(endpoint, headers=headers, timeout=15)
+    with _history_etags_lock:
+        cached = _history_etags.get(endpoint)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+    resp = _http_session().get(endpoint, headers=headers, timeout=15)
+    if resp.status_code == 304 and cached is not None:
+        logger.debug("Season history for %s not modified", username)
+        return [dict(row) for row in cached[1]]
     if resp.status_code >= 300:
-        global _last_error
-        _last_error = (
-            f"Supabase fetch failed: {resp.status_code} {resp.text[:2048]}"
-        )
-        logger.error("Supabase fetch failed: %s %s", resp.status_code, resp.text)
+        error = _set_last_error(f"Supabase fetch failed: {resp.status_code} {resp.text[:ERROR_BODY_CHARS]}")
+        logger.error(error)
         return []
     data = resp.json() or []
     logger.debug("Fetched %d history rows for %s", len(data), username)
     if not isinstance(data, list):
         return []
+    etag = resp.headers.get("ETag")
+    if etag:
+        # Keep a private copy so callers mutating their rows cannot alter what a 304 replays.
+        with _history_etags_lock:
+            _history_etags[endpoint] = (etag, [dict(row) for row in data])
     return data
 
 
@@ -397,14 +610,13 @@ def update_season_currency(username: str, season_id: int, currency: str) -> bool
 
     url, key = creds
     headers = _build_auth_headers(key, content_type="application/json")
-    resp = requests.patch(
+    resp = _http_session().patch(
         f"{url}/rest/v1/{SEASON_TABLE}?username=eq.{username}&season_id=eq.{season_id}",
-        json={"payout_currency": currency},
+        data=_json_body({"payout_currency": currency}),
         headers=headers,
         timeout=15,
     )
     if resp.status_code >= 300:
-        global _last_error
-        _last_error = f"Supabase update failed: {resp.status_code} {resp.text}"
+        _set_last_error(f"Supabase update failed: {resp.status_code} {resp.text[:ERROR_BODY_CHARS]}")
         return False
     return True
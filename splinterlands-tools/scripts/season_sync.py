@@ -16,7 +16,7 @@ from scholar_helper.services.api import (
     fetch_tournaments,
     fetch_unclaimed_balance_history,
 )
-from scholar_helper.services.storage import upsert_season_totals, upsert_tournament_logs
+from scholar_helper.services.storage import upsert_season_totals_many, upsert_tournament_logs_many
 
 
 def _parse_usernames(value: str | None) -> list[str]:
@@ -48,17 +48,28 @@ def _sync_for_season(
         logging.exception("Unable to fetch prices: %s", exc)
         return
 
+    season_entries = []
+    tournament_entries = []
     for username in usernames:
-        logging.info("Syncing %s for season %s", username, season.id)
+        logging.info("Collecting %s for season %s", username, season.id)
         try:
             rewards = fetch_unclaimed_balance_history(username)
             tournaments = fetch_tournaments(username)
             totals = aggregate_totals(season, rewards, tournaments, prices)
-            upsert_season_totals(season, username, totals, scholar_pct, payout_currency)
-            upsert_tournament_logs(tournaments, username)
-            logging.info("Successfully synced %s", username)
         except Exception as exc:
-            logging.exception("Failed to sync %s: %s", username, exc)
+            logging.exception("Failed to collect %s: %s", username, exc)
+            continue
+        season_entries.append((season, username, totals))
+        tournament_entries.append((username, tournaments))
+
+    if not season_entries:
+        return
+    try:
+        upsert_season_totals_many(season_entries, scholar_pct, payout_currency)
+        upsert_tournament_logs_many(tournament_entries)
+        logging.info("Successfully synced %d users", len(season_entries))
+    except Exception as exc:
+        logging.exception("Failed to upsert season snapshot: %s", exc)
 
 
 def main() -> None:
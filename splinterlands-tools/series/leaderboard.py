@@ -5,10 +5,15 @@ import pandas as pd
 import streamlit as st
 
 from core.config import setup_page
+from features.series.service import (
+    aggregate_series_totals,
+    cached_configs,
+    cached_events,
+    cached_results,
+    event_ids_key,
+    event_results_frame,
+)
 from scholar_helper.services.storage import (
-    fetch_series_configs,
-    fetch_tournament_events_supabase,
-    fetch_tournament_results_supabase,
     get_last_supabase_error,
 )
 
@@ -25,15 +30,16 @@ def setup_if_standalone() -> None:
 
 
 def _parse_date(value) -> datetime | None:
+    # Stored rows carry ISO strings, so check those first; 3.11's fromisoformat accepts a trailing "Z".
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
     if isinstance(value, datetime):
         return value
     if isinstance(value, date):
         return datetime.combine(value, datetime.min.time())
-    if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except Exception:
-            return None
     return None
 
 
@@ -77,7 +83,7 @@ def render_page(embed_mode: bool = False) -> None:
         st.info("Enter an organizer to load their saved series configs.")
         return
 
-    configs = fetch_series_configs(organizer)
+    configs = cached_configs(organizer)
     if not configs:
         supabase_error = get_last_supabase_error()
         if supabase_error:
@@ -119,7 +125,7 @@ def render_page(embed_mode: bool = False) -> None:
         st.info(note)
 
     with st.spinner("Loading tournaments from the database..."):
-        tournaments = fetch_tournament_events_supabase(
+        tournaments = cached_events(
             organizer,
             since=since_dt,
             until=until_dt,
@@ -153,8 +159,8 @@ def render_page(embed_mode: bool = False) -> None:
     }.get(scheme, "points_balanced")
 
     with st.spinner("Computing leaderboard..."):
-        result_rows = fetch_tournament_results_supabase(
-            tournament_ids=event_ids,
+        result_rows = cached_results(
+            event_ids_key(event_ids),
             organizer=organizer,
             since=since_dt,
             until=until_dt,
@@ -164,42 +170,7 @@ def render_page(embed_mode: bool = False) -> None:
         st.info("No leaderboard rows found.")
         return
 
-    totals_map: dict[str, dict[str, object]] = {}
-    for row in result_rows:
-        player = str(row.get("player") or "").strip()
-        if not player:
-            continue
-        pts = _as_float(row.get(points_key)) or 0
-        finish = row.get("finish")
-        agg = totals_map.setdefault(
-            player,
-            {"points": 0.0, "events": 0, "finishes": [], "podiums": 0},
-        )
-        agg["points"] += pts
-        agg["events"] += 1
-        if finish is not None:
-            agg["finishes"].append(finish)
-            if isinstance(finish, (int, float)) and 1 <= float(finish) <= 3:
-                agg["podiums"] += 1
-
-    total_rows = []
-    for player, agg in totals_map.items():
-        finishes = [f for f in agg["finishes"] if f is not None]
-        avg_finish = sum(finishes) / len(finishes) if finishes else None
-        best_finish = min(finishes) if finishes else None
-        total_rows.append(
-            {
-                "Player": player,
-                "Points": agg["points"],
-                "Events": agg["events"],
-                "Avg Finish": avg_finish,
-                "Best": best_finish,
-                "Podiums": agg["podiums"],
-            }
-        )
-
-    total_rows.sort(key=lambda r: r["Points"], reverse=True)
-    df = pd.DataFrame(total_rows)
+    df = aggregate_series_totals(result_rows, points_key)
     styler = df.style
     if cutoff is not None and cutoff > 0:
         ticket_icon = "🎫"
@@ -256,23 +227,16 @@ def render_page(embed_mode: bool = False) -> None:
 
     # Event list and single leaderboard view
     st.subheader("Events")
-    rows = []
-    for t in tournaments:
-        start_dt = _parse_date(t.get("start_date"))
-        rows.append(
-            {
-                "Date": _format_date(start_dt),
-                "Tournament": t.get("name") or t.get("tournament_id"),
-            }
-        )
+    dates = [_format_date(_parse_date(t.get("start_date"))) for t in tournaments]
+    names = [t.get("name") or t.get("tournament_id") for t in tournaments]
     st.dataframe(
-        rows,
+        pd.DataFrame({"Date": dates, "Tournament": names}),
         hide_index=True,
         width="stretch",
-        height=_table_height_for_rows(len(rows), min_height=180, extra=90),
+        height=_table_height_for_rows(len(dates), min_height=180, extra=90),
     )
 
-    labels = [f"{row['Date']} - {row['Tournament']}" for row in rows]
+    labels = [f"{date_label} - {name}" for date_label, name in zip(dates, names)]
     selected_label = st.selectbox("View event leaderboard", options=labels, index=0)
     selected_idx = labels.index(selected_label)
     selected_event = tournaments[selected_idx]
@@ -282,15 +246,7 @@ def render_page(embed_mode: bool = False) -> None:
     st.subheader(f"Leaderboard: {selected_event.get('name') or tournament_id}")
     if leaderboard:
         st.dataframe(
-            [
-                {
-                    "Finish": row.get("finish"),
-                    "Player": row.get("player"),
-                    "Points": _as_float(row.get(points_key)),
-                    "Prizes": row.get("prize_text"),
-                }
-                for row in leaderboard
-            ],
+            event_results_frame(leaderboard, points_key),
             hide_index=True,
             width="stretch",
             height=_table_height_for_rows(len(leaderboard), min_height=220, extra=100),
@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, date, timezone
+from functools import lru_cache
 import pandas as pd
 
 import streamlit as st
 
 from core.config import setup_page
+from features.series.service import (
+    aggregate_series_totals,
+    cached_configs,
+    cached_event_results,
+    cached_events,
+    cached_organizers,
+    cached_results,
+    cached_schemes,
+    event_ids_key,
+    event_results_frame,
+)
 from scholar_helper.services.api import fetch_hosted_tournaments, fetch_tournament_leaderboard
 from scholar_helper.services.storage import (
-    fetch_tournament_events_supabase,
-    fetch_tournament_results_supabase,
-    fetch_tournament_ingest_organizers,
-    fetch_series_configs,
-    fetch_point_schemes,
     get_last_supabase_error,
 )
 
@@ -89,9 +96,19 @@ def _format_date(value: datetime | None) -> str:
 def _format_ruleset(allowed_cards: dict | None) -> str:
     if not isinstance(allowed_cards, dict):
         return "-"
-    epoch = allowed_cards.get("epoch") or allowed_cards.get("type") or "Ruleset"
-    ghost = allowed_cards.get("ghost")
-    cards = allowed_cards.get("type") or "All"
+    key = (allowed_cards.get("epoch"), allowed_cards.get("type"), allowed_cards.get("ghost"))
+    try:
+        return _format_ruleset_cached(key)
+    except TypeError:
+        # Unhashable values (e.g. a list of card types) skip the cache.
+        return _format_ruleset_cached.__wrapped__(key)
+
+
+@lru_cache(maxsize=512)
+def _format_ruleset_cached(key: tuple) -> str:
+    epoch_value, type_value, ghost = key
+    epoch = epoch_value or type_value or "Ruleset"
+    cards = type_value or "All"
     epoch_label = str(epoch).title()
     type_label = f"{epoch_label} {'Ghost' if ghost else 'Owned'}"
     cards_label = "All" if str(cards).lower() == "all" else str(cards).title()
@@ -99,15 +116,16 @@ def _format_ruleset(allowed_cards: dict | None) -> str:
 
 
 def _parse_date(value) -> datetime | None:
+    # Stored rows carry ISO strings, so check those first; 3.11's fromisoformat accepts a trailing "Z".
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
     if isinstance(value, datetime):
         return value
     if isinstance(value, date):
         return datetime.combine(value, datetime.min.time())
-    if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except Exception:
-            return None
     return None
 
 
@@ -120,13 +138,6 @@ def _to_iso_date(value) -> str | None:
     return dt.isoformat()
 
 
-def _as_float(value):
-    try:
-        return float(value)
-    except Exception:
-        return None
-
-
 def _render_scheme_rules(scheme: dict) -> list[dict]:
     rules = scheme.get("rules") or []
     rows = []
@@ -266,7 +277,7 @@ def render_page(embed_mode: bool = False) -> None:
         st.title("Tournament Series")
         st.caption("Stored list of hosted tournaments with cached leaderboards.")
 
-    organizers = fetch_tournament_ingest_organizers()
+    organizers = cached_organizers()
     col_org_1, col_org_2 = st.columns(2)
     with col_org_1:
         selected_org = st.selectbox(
@@ -289,7 +300,7 @@ def render_page(embed_mode: bool = False) -> None:
         st.warning("Enter or select an organizer, then click Load.")
         return
 
-    configs = fetch_series_configs(username) if username else []
+    configs = cached_configs(username) if username else []
     config_labels = ["(No saved config)"] + [cfg.get("name") or str(cfg.get("id")) for cfg in configs]
     selected_config_label = st.selectbox("Series config (optional)", options=config_labels, index=0)
     selected_config = None
@@ -332,7 +343,7 @@ def render_page(embed_mode: bool = False) -> None:
             # Normalize label to match the overridden scheme.
             scheme_label = next((label for label, slug in scheme_options.items() if slug == scheme), scheme_label)
 
-    schemes = fetch_point_schemes()
+    schemes = cached_schemes()
     scheme_map = {s.get("slug"): s for s in schemes} if schemes else {}
     scheme_def = _resolve_scheme(scheme_map, scheme)
 
@@ -341,7 +352,7 @@ def render_page(embed_mode: bool = False) -> None:
     source = "supabase"
     results_by_event: dict[str, list[dict]] = {}
     with st.spinner(f"Loading tournaments ingested for {username}..."):
-        tournaments = fetch_tournament_events_supabase(
+        tournaments = cached_events(
             username,
             since=_parse_date(since_date),
             until=_parse_date(until_date),
@@ -378,48 +389,59 @@ def render_page(embed_mode: bool = False) -> None:
             st.caption("Loaded tournaments from stored data.")
 
     # Optional ruleset filter derived from available allowed_cards.
-    ruleset_labels = sorted({(_format_ruleset(t.get("allowed_cards")) or "-") for t in tournaments})
-    ruleset_labels = [label for label in ruleset_labels if label and label != "-"]
+    ruleset_set: set[str] = set()
+    for t in tournaments:
+        # Memoize the derived fields on the row so the filter, table and labels below reuse them.
+        t["_rs"] = _format_ruleset(t.get("allowed_cards"))
+        t["_sd"] = _parse_date(t.get("start_date"))
+        ruleset_set.add(t["_rs"] or "-")
+    ruleset_labels = [label for label in sorted(ruleset_set) if label and label != "-"]
     ruleset_labels.insert(0, "All rulesets")
     selected_ruleset = st.selectbox("Ruleset filter (optional)", options=ruleset_labels, index=0)
-    if selected_ruleset != "All rulesets":
-        tournaments = [t for t in tournaments if _format_ruleset(t.get("allowed_cards")) == selected_ruleset]
-        if not tournaments:
-            st.info("No tournaments match that ruleset for the selected filters.")
-            return
-
-    if name_filter:
-        name_lower = name_filter.lower()
-        tournaments = [
-            t for t in tournaments if name_lower in str(t.get("name") or t.get("tournament_id") or "").lower()
-        ]
-        if not tournaments:
-            st.info("No tournaments match that name for the selected filters.")
-            return
-
-    # Filter by include/exclude ids from config.
-    if include_ids:
-        tournaments = [t for t in tournaments if t.get("tournament_id") in include_ids]
-    if exclude_ids:
-        tournaments = [t for t in tournaments if t.get("tournament_id") not in exclude_ids]
-
-    # Trim to last N after filtering.
-    if limit and len(tournaments) > limit:
-        tournaments = tournaments[:limit]
 
-    rows = []
+    # Single pass: ruleset, name and config id filters, then trim to last N after filtering.
+    name_lower = name_filter.lower() if name_filter else ""
+    ruleset_hits = name_hits = 0
+    filtered: list[dict] = []
+    dates: list[str] = []
+    names: list[str] = []
+    rulesets: list[str] = []
+    event_ids = []
+    labels = []
     for t in tournaments:
-        start_dt = _parse_date(t.get("start_date"))
-        rows.append(
-            {
-                "Date": _format_date(start_dt),
-                "Tournament": t.get("name") or t.get("tournament_id"),
-                "Ruleset": _format_ruleset(t.get("allowed_cards")),
-            }
-        )
+        if selected_ruleset != "All rulesets" and t["_rs"] != selected_ruleset:
+            continue
+        ruleset_hits += 1
+        tournament_name = t.get("name") or t.get("tournament_id")
+        if name_lower and name_lower not in str(tournament_name or "").lower():
+            continue
+        name_hits += 1
+        tid = t.get("tournament_id")
+        if include_ids and tid not in include_ids:
+            continue
+        if exclude_ids and tid in exclude_ids:
+            continue
+        filtered.append(t)
+        date_label = _format_date(t["_sd"])
+        dates.append(date_label)
+        names.append(tournament_name)
+        rulesets.append(t["_rs"])
+        labels.append(f"{date_label} - {tournament_name}")
+        if tid:
+            event_ids.append(tid)
+        if limit and len(filtered) >= limit:
+            break
+
+    if not ruleset_hits:
+        st.info("No tournaments match that ruleset for the selected filters.")
+        return
+    if not name_hits:
+        st.info("No tournaments match that name for the selected filters.")
+        return
+    tournaments = filtered
 
     st.dataframe(
-        rows,
+        pd.DataFrame({"Date": dates, "Tournament": names, "Ruleset": rulesets}),
         hide_index=True,
         width="stretch",
         column_config={
@@ -436,12 +458,10 @@ def render_page(embed_mode: bool = False) -> None:
         "participation": "points_participation",
     }.get(scheme, "points_balanced")
 
-    event_ids = [t.get("tournament_id") for t in tournaments if t.get("tournament_id")]
-
     if source == "supabase":
         with st.spinner("Computing series leaderboard..."):
-            result_rows = fetch_tournament_results_supabase(
-                tournament_ids=event_ids,
+            result_rows = cached_results(
+                event_ids_key(event_ids),
                 organizer=username,
                 since=_parse_date(since_date),
                 until=_parse_date(until_date),
@@ -456,41 +476,7 @@ def render_page(embed_mode: bool = False) -> None:
             )
 
     if result_rows:
-        totals_map: dict[str, dict[str, object]] = {}
-        for row in result_rows:
-            player = str(row.get("player") or "").strip()
-            if not player:
-                continue
-            pts = _as_float(row.get(points_key)) or 0
-            finish = row.get("finish")
-            agg = totals_map.setdefault(
-                player,
-                {"points": 0.0, "events": 0, "finishes": [], "podiums": 0},
-            )
-            agg["points"] += pts
-            agg["events"] += 1
-            if finish is not None:
-                agg["finishes"].append(finish)
-                if isinstance(finish, (int, float)) and 1 <= float(finish) <= 3:
-                    agg["podiums"] += 1
-
-        total_rows = []
-        for player, agg in totals_map.items():
-            finishes = [f for f in agg["finishes"] if f is not None]
-            avg_finish = sum(finishes) / len(finishes) if finishes else None
-            best_finish = min(finishes) if finishes else None
-            total_rows.append(
-                {
-                    "Player": player,
-                    "Points": agg["points"],
-                    "Events": agg["events"],
-                    "Avg Finish": avg_finish,
-                    "Best": best_finish,
-                    "Podiums": agg["podiums"],
-                }
-            )
-
-        total_rows.sort(key=lambda r: r["Points"], reverse=True)
+        totals_df = aggregate_series_totals(result_rows, points_key)
         ruleset_title = "Full"
         if name_filter:
             ruleset_title = name_filter.strip().capitalize()
@@ -512,7 +498,7 @@ def render_page(embed_mode: bool = False) -> None:
                 step=1.0,
                 help="Draw a red line showing who meets the cutoff.",
             )
-            df = pd.DataFrame(total_rows)
+            df = totals_df
             styler = df.style
             if threshold > 0:
                 # Ticket marker for qualifiers (emoji color depends on platform; 🎫 is usually gold/yellow).
@@ -569,7 +555,7 @@ def render_page(embed_mode: bool = False) -> None:
             )
         with tabs[1]:
             st.subheader("Point Schemes")
-            schemes_for_tab = schemes or fetch_point_schemes()
+            schemes_for_tab = schemes or cached_schemes()
             if not schemes_for_tab:
                 st.info("No point schemes found in the backend.")
             else:
@@ -595,10 +581,6 @@ def render_page(embed_mode: bool = False) -> None:
     else:
         st.info("No leaderboard rows found for the selected window.")
 
-    labels = []
-    for t in tournaments:
-        start_dt = _parse_date(t.get("start_date"))
-        labels.append(f"{_format_date(start_dt)} - {t.get('name') or t.get('tournament_id')}")
     if not labels:
         return
 
@@ -609,20 +591,12 @@ def render_page(embed_mode: bool = False) -> None:
     tournament_id = selected.get("tournament_id") or selected.get("id")
     if source == "supabase":
         with st.spinner(f"Loading leaderboard for {selected.get('name') or tournament_id}..."):
-            leaderboard = fetch_tournament_results_supabase(tournament_id)
+            leaderboard = cached_event_results(tournament_id)
     else:
         leaderboard = results_by_event.get(tournament_id) or []
     if leaderboard:
         st.dataframe(
-            [
-                {
-                    "Finish": row.get("finish"),
-                    "Player": row.get("player"),
-                    "Points": _as_float(row.get(points_key)),
-                    "Prizes": row.get("prize_text"),
-                }
-                for row in leaderboard
-            ],
+            event_results_frame(leaderboard, points_key),
             hide_index=True,
             width="stretch",
             column_config={
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the app packages the same way Streamlit does, from the splinterlands-tools root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
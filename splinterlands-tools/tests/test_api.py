@@ -0,0 +1,30 @@
+import logging
+
+import httpx
+
+from scholar_helper.services import api
+
+
+class _Client:
+    def get(self, url, params=None):
+        request = httpx.Request("GET", url)
+        if url.endswith("/tournaments/find"):
+            if params["id"] == "t2":
+                return httpx.Response(429, request=request)
+            return httpx.Response(200, json={"id": params["id"], "players": []}, request=request)
+        rows = [
+            {"id": "t1", "name": "One", "start_date": "2024-01-02T00:00:00.000Z"},
+            {"id": "t2", "name": "Two", "start_date": "2024-01-01T00:00:00.000Z"},
+        ]
+        return httpx.Response(200, json=rows, request=request)
+
+
+def test_fetch_tournaments_reports_failed_details(monkeypatch, caplog):
+    monkeypatch.setattr(api, "_client", _Client())
+
+    with caplog.at_level(logging.WARNING, logger=api.__name__):
+        results = api.fetch_tournaments("scholar")
+
+    assert [t.id for t in results] == ["t1", "t2"]
+    assert "detail" not in results[1].raw
+    assert any("1 of 2 tournaments for scholar" in record.getMessage() for record in caplog.records)
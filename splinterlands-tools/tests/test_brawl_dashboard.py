@@ -0,0 +1,24 @@
+import pandas as pd
+
+from scholar_helper.services import brawl_dashboard
+
+
+def test_build_player_rows_accepts_string_cycles(monkeypatch):
+    history = pd.DataFrame(
+        {
+            "tournament_id": ["b1", "b2", "b3", "b4"],
+            "cycle": ["9", "10", "8", None],
+        }
+    )
+    fetched = []
+
+    def fetch(tournament_id, guild_id):
+        fetched.append(tournament_id)
+        return {"players": [{"player": "scholar", "wins": 2, "losses": 1}]}
+
+    monkeypatch.setattr(brawl_dashboard, "fetch_brawl_details", fetch)
+
+    rows = brawl_dashboard.build_player_rows("guild", history, max_brawls=2)
+
+    assert sorted(fetched) == ["b1", "b2"]
+    assert sorted(rows["cycle"].tolist()) == [9, 10]
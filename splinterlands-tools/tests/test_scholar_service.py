@@ -0,0 +1,60 @@
+import pytest
+
+from features.scholar import service
+from scholar_helper.models import TournamentResult
+from scholar_helper.services import storage
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    service.clear_caches()
+    yield
+    service.clear_caches()
+
+
+def test_failed_history_fetch_is_not_cached(monkeypatch):
+    record = {"season_id": 150, "username": "scholar"}
+    calls = []
+
+    def fetch(username):
+        calls.append(username)
+        if len(calls) == 1:
+            storage._set_last_error("Supabase unavailable")
+            return []
+        storage._set_last_error(None)
+        return [record]
+
+    monkeypatch.setattr(service, "fetch_season_history", fetch)
+
+    assert service.cached_history("scholar") == []
+    assert storage.get_last_supabase_error() == "Supabase unavailable"
+    history = service.cached_history("scholar")
+    assert [entry[0] for entry in history] == [record]
+    service.cached_history("scholar")
+    assert len(calls) == 2
+
+
+def _tournament(players):
+    return TournamentResult(id="t1", name="Brawl", start_date=None, entry_fee=None, raw={"detail": {"players": players}})
+
+
+def test_finish_index_skips_empty_and_clears_with_caches():
+    assert service._finish_index(_tournament([])) == {}
+    assert "t1" not in service._finish_index_cache
+
+    assert service._finish_index(_tournament([{"player": "Scholar", "finish": 3}])) == {"scholar": 3}
+    assert "t1" in service._finish_index_cache
+
+    service.clear_caches()
+    assert "t1" not in service._finish_index_cache
+
+
+def test_parse_token_amounts_returns_fresh_floats():
+    payload = {"SPS": 3, "DEC": 1.5}
+
+    tokens = service._parse_token_amounts(payload)
+    tokens["SPS"] += 1
+
+    assert tokens is not payload
+    assert type(service._parse_token_amounts(payload)["SPS"]) is float
+    assert payload == {"SPS": 3, "DEC": 1.5}
@@ -0,0 +1,65 @@
+import pytest
+
+from features.series import service
+from scholar_helper.services import storage
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    service.clear_caches()
+    yield
+    service.clear_caches()
+
+
+def _flaky_fetch(rows):
+    """First call fails the way storage fetchers do (empty result plus last error); later calls succeed."""
+    calls = []
+
+    def fetch(*_args, **_kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            storage._set_last_error("Supabase unavailable")
+            return []
+        storage._set_last_error(None)
+        return rows
+
+    return fetch, calls
+
+
+@pytest.mark.parametrize(
+    "fetcher, call",
+    [
+        ("fetch_tournament_ingest_organizers", lambda: service.cached_organizers()),
+        ("fetch_series_configs", lambda: service.cached_configs("organizer")),
+        ("fetch_point_schemes", lambda: service.cached_schemes()),
+    ],
+)
+def test_failed_reference_fetch_is_not_cached(monkeypatch, fetcher, call):
+    rows = [{"id": 1}]
+    fetch, calls = _flaky_fetch(rows)
+    monkeypatch.setattr(service, fetcher, fetch)
+
+    assert call() == []
+    assert storage.get_last_supabase_error() == "Supabase unavailable"
+    assert call() == rows
+    assert call() == rows
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "fetcher, call",
+    [
+        ("fetch_tournament_events_supabase", lambda: service.cached_events("organizer")),
+        ("fetch_tournament_results_supabase", lambda: service.cached_results(("t1", "t2"))),
+        ("fetch_tournament_results_supabase", lambda: service.cached_event_results("t1")),
+    ],
+)
+def test_failed_results_fetch_is_not_cached(monkeypatch, fetcher, call):
+    rows = [{"tournament_id": "t1"}]
+    fetch, calls = _flaky_fetch(rows)
+    monkeypatch.setattr(service, fetcher, fetch)
+
+    assert call() == []
+    assert call() == rows
+    assert call() == rows
+    assert len(calls) == 2
@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+import numpy as np
+import orjson
+import pytest
+
+from scholar_helper.models import TokenAmount, TournamentResult
+from scholar_helper.services import storage
+
+
+def test_json_body_keeps_numpy_scalars_numeric():
+    body = storage._json_body({"wins": np.int64(3), "ratio": np.float64(0.5), "amount": Decimal("1.25")})
+
+    assert orjson.loads(body) == {"wins": 3, "ratio": 0.5, "amount": 1.25}
+
+
+def test_json_body_rejects_unexpected_types():
+    with pytest.raises(TypeError):
+        storage._json_body({"value": object()})
+
+
+def test_tournament_log_row_writes_only_token_and_amount():
+    reward = TokenAmount(token="SPS", amount=1.0)
+    reward.usd = 2
+    tournament = TournamentResult(id="t1", name="Brawl", start_date=None, entry_fee=None, rewards=[reward])
+
+    row = orjson.loads(storage._json_body(storage._tournament_log_row(tournament, "scholar")))
+
+    assert row["rewards"] == [{"token": "SPS", "amount": 1.0}]
+
+
+class _Response:
+    def __init__(self, status_code, rows=None, etag=None):
+        self.status_code = status_code
+        self._rows = rows
+        self.headers = {"ETag": etag} if etag else {}
+        self.text = ""
+
+    def json(self):
+        return self._rows
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_season_history_304_replays_private_copies(monkeypatch):
+    session = _Session([_Response(200, [{"season_id": 150}], etag='"v1"'), _Response(304), _Response(304)])
+    monkeypatch.setattr(storage, "get_supabase_client", lambda: ("https://db.example", "key"))
+    monkeypatch.setattr(storage, "_http_session", lambda: session)
+    storage.reset_supabase_cache()
+
+    first = storage.fetch_season_history("scholar")
+    first[0]["season_id"] = 0
+    second = storage.fetch_season_history("scholar")
+    second[0]["season_id"] = 1
+    third = storage.fetch_season_history("scholar")
+
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+    assert third == [{"season_id": 150}]
+    storage.reset_supabase_cache()